@@ -1,6 +1,7 @@
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy import text
 from alembic import context
 import os
 import sys
@@ -18,10 +19,13 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from app.core.database import Base
-from app.models import User, Household, Chore, ChoreAssignment
+from app.models import User, Household, Chore, ChoreAssignment, ChoreTombstone, IdempotencyKey
 
 target_metadata = Base.metadata
 
+# Every replica runs migrations on startup; this advisory lock serializes them
+MIGRATION_LOCK_ID = 7343920615
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -75,6 +79,8 @@ def run_migrations_online() -> None:
         )
 
         with context.begin_transaction():
+            if connection.dialect.name == "postgresql":
+                connection.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
             context.run_migrations()
 
 
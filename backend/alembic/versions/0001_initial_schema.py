@@ -0,0 +1,85 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases created by the app's old create_all() startup hook already
+    # have this schema but no alembic_version row; adopt them as-is.
+    if sa.inspect(op.get_bind()).has_table("households"):
+        return
+    
+    op.create_table(
+        "households",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("admin_id", sa.UUID(), nullable=False),
+        sa.Column("invite_code", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("invite_code"),
+    )
+    op.create_table(
+        "users",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("firebase_uid", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("display_name", sa.String(), nullable=True),
+        sa.Column("household_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["household_id"], ["households.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_firebase_uid", "users", ["firebase_uid"], unique=True)
+    op.create_foreign_key("households_admin_id_fkey", "households", "users", ["admin_id"], ["id"])
+    op.create_table(
+        "chores",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("household_id", sa.UUID(), nullable=False),
+        sa.Column("created_by_id", sa.UUID(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("due_date", sa.Date(), nullable=False),
+        sa.Column("is_recurring", sa.Boolean(), nullable=True),
+        sa.Column("recurrence_interval", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["created_by_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["household_id"], ["households.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "chore_assignments",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("chore_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["chore_id"], ["chores.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("chore_assignments")
+    op.drop_table("chores")
+    op.drop_constraint("households_admin_id_fkey", "households", type_="foreignkey")
+    op.drop_index("ix_users_firebase_uid", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    op.drop_table("households")
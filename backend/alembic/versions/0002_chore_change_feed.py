@@ -0,0 +1,45 @@
+"""Add per-household change sequence and chore tombstones
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("households", sa.Column("change_seq", sa.BigInteger(), server_default="0", nullable=False))
+    op.add_column("chores", sa.Column("change_seq", sa.BigInteger(), server_default="0", nullable=False))
+    op.create_index("ix_chores_household_id_change_seq", "chores", ["household_id", "change_seq"])
+    op.create_table(
+        "chore_tombstones",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("household_id", sa.UUID(), nullable=False),
+        sa.Column("chore_id", sa.UUID(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["household_id"], ["households.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_chore_tombstones_household_id_change_seq",
+        "chore_tombstones",
+        ["household_id", "change_seq"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chore_tombstones_household_id_change_seq", table_name="chore_tombstones")
+    op.drop_table("chore_tombstones")
+    op.drop_index("ix_chores_household_id_change_seq", table_name="chores")
+    op.drop_column("chores", "change_seq")
+    op.drop_column("households", "change_seq")
@@ -0,0 +1,42 @@
+"""Add chore search and filter indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_chores_household_id_due_date_id", "chores", ["household_id", "due_date", "id"])
+    op.create_index("ix_chore_assignments_chore_id", "chore_assignments", ["chore_id"])
+    op.create_index("ix_chore_assignments_user_id_status", "chore_assignments", ["user_id", "status"])
+
+    # Trigram indexes only exist on PostgreSQL; elsewhere text search is a scan
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_chores_title_trgm", "chores", ["title"],
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        )
+        op.create_index(
+            "ix_chores_description_trgm", "chores", ["description"],
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_chores_description_trgm", table_name="chores")
+        op.drop_index("ix_chores_title_trgm", table_name="chores")
+    op.drop_index("ix_chore_assignments_user_id_status", table_name="chore_assignments")
+    op.drop_index("ix_chore_assignments_chore_id", table_name="chore_assignments")
+    op.drop_index("ix_chores_household_id_due_date_id", table_name="chores")
@@ -0,0 +1,24 @@
+"""Add idempotency key claim owner
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("idempotency_keys", sa.Column("claim_id", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("idempotency_keys", "claim_id")
@@ -4,7 +4,10 @@ from sqlalchemy.orm import Session
 from jose import jwt, JWTError
 import firebase_admin
 from firebase_admin import credentials, auth as firebase_auth
+import hashlib
 import os
+import time
+from typing import Dict, Optional, Tuple
 from .config import settings
 from ..core.database import get_db
 from ..models.user import User
@@ -43,6 +46,39 @@ async def verify_firebase_token(credentials: HTTPAuthorizationCredentials = Depe
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+# Decoded tokens keyed by a hash of the raw token, with their expiry time
+_verified_tokens: Dict[str, Tuple[float, dict]] = {}
+MAX_VERIFIED_TOKENS = 10000
+
+def verify_bearer_header(authorization: Optional[str]) -> Optional[dict]:
+    """Verify an `Authorization: Bearer` header outside of route dependencies.
+
+    Middlewares use this to identify the caller before routing. Decoded tokens
+    are cached until they expire; returns None for a missing or invalid token.
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    
+    key = hashlib.sha256(token.encode()).hexdigest()
+    now = time.time()
+    cached = _verified_tokens.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    try:
+        decoded_token = firebase_auth.verify_id_token(token)
+    except Exception:
+        return None
+    
+    if len(_verified_tokens) >= MAX_VERIFIED_TOKENS:
+        for stale in [k for k, (expires, _) in _verified_tokens.items() if expires <= now]:
+            del _verified_tokens[stale]
+        if len(_verified_tokens) >= MAX_VERIFIED_TOKENS:
+            _verified_tokens.clear()
+    _verified_tokens[key] = (float(decoded_token.get("exp", now + 60)), decoded_token)
+    return decoded_token
+
 async def get_current_user(
     decoded_token: dict = Depends(verify_firebase_token),
     db: Session = Depends(get_db)
@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from uuid import UUID
+import hashlib
+import hmac
+import threading
+import time
+
+from .config import settings
+
+FEED_KINDS = ("household", "mine")
+
+# RFC 5545 recurrence rules for Chore.recurrence_interval
+RECURRENCE_RULES = {
+    "daily": "FREQ=DAILY",
+    "weekly": "FREQ=WEEKLY",
+    "bi-weekly": "FREQ=WEEKLY;INTERVAL=2",
+}
+
+def _signature(kind: str, user_id: UUID, household_id: UUID) -> str:
+    message = f"calendar:{kind}:{user_id.hex}:{household_id.hex}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+def create_feed_token(kind: str, user_id: UUID, household_id: UUID) -> str:
+    return f"{user_id.hex}.{household_id.hex}.{_signature(kind, user_id, household_id)}"
+
+def verify_feed_token(kind: str, token: str) -> Optional[Tuple[UUID, UUID]]:
+    """Return (user_id, household_id) for a token signed for this feed kind, else None"""
+    try:
+        user_hex, household_hex, signature = token.split(".")
+        user_id, household_id = UUID(hex=user_hex), UUID(hex=household_hex)
+    except ValueError:
+        return None
+    if not hmac.compare_digest(signature, _signature(kind, user_id, household_id)):
+        return None
+    return user_id, household_id
+
+@dataclass(frozen=True)
+class CachedFeed:
+    etag: str
+    last_modified: datetime
+    body: Optional[bytes]  # None for a validator-only entry, which can only answer 304s
+    expires_at: float
+
+class CalendarFeedCache:
+    """Per-process cache of rendered feeds, keyed by (kind, user_id, household_id).
+
+    Entries are per subscriber, so a hit only serves the member whose
+    membership was checked when the entry was rendered. They are dropped
+    whenever the household's chores or members change in this process, and
+    expire after CALENDAR_CACHE_TTL_SECONDS, which bounds staleness for
+    changes made by other workers.
+    """
+
+    MAX_ENTRIES = 5000
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, UUID, UUID], CachedFeed] = {}
+        self._generations: Dict[UUID, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[CachedFeed]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry.expires_at > time.monotonic():
+            return entry
+        return None
+
+    def generation(self, household_id: UUID) -> int:
+        with self._lock:
+            return self._generations.get(household_id, 0)
+
+    def put(self, key, generation: int, etag: str, last_modified: datetime, body: Optional[bytes]) -> None:
+        """Store a rendered feed unless its household changed while it was rendering"""
+        household_id = key[2]
+        with self._lock:
+            if self._generations.get(household_id, 0) != generation:
+                return
+            if len(self._entries) >= self.MAX_ENTRIES:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = CachedFeed(
+                etag=etag,
+                last_modified=last_modified,
+                body=body,
+                expires_at=time.monotonic() + settings.CALENDAR_CACHE_TTL_SECONDS
+            )
+
+    def invalidate(self, household_id: UUID) -> None:
+        with self._lock:
+            self._generations[household_id] = self._generations.get(household_id, 0) + 1
+            for key in [key for key in self._entries if key[2] == household_id]:
+                del self._entries[key]
+
+calendar_cache = CalendarFeedCache()
+
+def invalidate_calendar_feeds(household_id: UUID) -> None:
+    calendar_cache.invalidate(household_id)
+
+def _escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets as required by RFC 5545"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a UTF-8 multi-byte sequence
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+        limit = 74
+    return "\r\n ".join(parts) + "\r\n"
+
+def render_calendar(name: str, chores: Iterable[tuple], stamp: datetime) -> Iterator[str]:
+    """Yield an iCalendar document one event at a time.
+
+    `chores` yields (id, title, description, due_date, recurrence_interval)
+    rows; recurring chores become a single event with an RRULE.
+    """
+    dtstamp = stamp.strftime("%Y%m%dT%H%M%SZ")
+    yield (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "PRODID:-//Chorrus//Chores//EN\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        + _fold(f"X-WR-CALNAME:{_escape_text(name)}")
+    )
+    for chore_id, title, description, due_date, recurrence_interval in chores:
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{chore_id}@chorrus",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART;VALUE=DATE:{due_date:%Y%m%d}",
+            f"SUMMARY:{_escape_text(title)}",
+        ]
+        if description:
+            lines.append(f"DESCRIPTION:{_escape_text(description)}")
+        if recurrence_interval in RECURRENCE_RULES:
+            lines.append(f"RRULE:{RECURRENCE_RULES[recurrence_interval]}")
+        lines.append("END:VEVENT")
+        yield "".join(_fold(line) for line in lines)
+    yield "END:VCALENDAR\r\n"
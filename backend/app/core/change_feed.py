@@ -0,0 +1,61 @@
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from .calendar_feed import invalidate_calendar_feeds
+from ..models.household import Household
+from ..models.chore import Chore
+from ..models.chore_tombstone import ChoreTombstone
+
+def mark_household_changed(db: Session, household_id: UUID) -> None:
+    """Drop the household's cached calendar feeds once this transaction commits"""
+    db.info.setdefault("changed_households", set()).add(household_id)
+
+def next_change_seq(db: Session, household_id: UUID) -> int:
+    """Bump and return the household's change sequence.
+
+    The UPDATE row-locks the household until the transaction commits, so
+    sequence numbers become visible in the order they were handed out.
+    """
+    mark_household_changed(db, household_id)
+    return db.execute(
+        update(Household)
+        .where(Household.id == household_id)
+        .values(change_seq=Household.change_seq + 1)
+        .returning(Household.change_seq)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_households(session: Session) -> None:
+    # Invalidate only once changes are visible, so a concurrent render cannot re-cache old data
+    for household_id in session.info.pop("changed_households", ()):
+        invalidate_calendar_feeds(household_id)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_households(session: Session) -> None:
+    session.info.pop("changed_households", None)
+
+def touch_chore(db: Session, chore: Chore) -> None:
+    """Stamp a created or modified chore (or its assignments) with a new sequence"""
+    chore.change_seq = next_change_seq(db, chore.household_id)
+
+def record_chore_deleted(db: Session, chore: Chore) -> None:
+    db.add(ChoreTombstone(
+        household_id=chore.household_id,
+        chore_id=chore.id,
+        change_seq=next_change_seq(db, chore.household_id)
+    ))
+
+def encode_sync_token(household_id: UUID, change_seq: int) -> str:
+    return f"{household_id.hex}.{change_seq}"
+
+def decode_sync_token(token: str) -> Optional[Tuple[UUID, int]]:
+    """Return (household_id, change_seq) for a well-formed token, else None"""
+    try:
+        household_hex, change_seq = token.split(".", 1)
+        return UUID(hex=household_hex), int(change_seq)
+    except ValueError:
+        return None
@@ -23,6 +23,32 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Caching
+    CALENDAR_CACHE_TTL_SECONDS: float = float(os.getenv("CALENDAR_CACHE_TTL_SECONDS", "300"))
+    
+    # Idempotency
+    IDEMPOTENCY_BACKEND: str = os.getenv("IDEMPOTENCY_BACKEND", "database")  # database, memory
+    IDEMPOTENCY_TTL_SECONDS: int = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_LEASE_SECONDS: int = int(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "60"))
+    
+    # Rate limiting and load shedding
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory, redis
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_USER_PER_SECOND: float = float(os.getenv("RATE_LIMIT_USER_PER_SECOND", "5"))
+    RATE_LIMIT_USER_BURST: int = int(os.getenv("RATE_LIMIT_USER_BURST", "20"))
+    RATE_LIMIT_HOUSEHOLD_PER_SECOND: float = float(os.getenv("RATE_LIMIT_HOUSEHOLD_PER_SECOND", "20"))
+    RATE_LIMIT_HOUSEHOLD_BURST: int = int(os.getenv("RATE_LIMIT_HOUSEHOLD_BURST", "60"))
+    LOAD_SHED_MAX_IN_FLIGHT: int = int(os.getenv("LOAD_SHED_MAX_IN_FLIGHT", "64"))
+    LOAD_SHED_MIN_IN_FLIGHT: int = int(os.getenv("LOAD_SHED_MIN_IN_FLIGHT", "4"))
+    LOAD_SHED_POOL_WAIT_MS: float = float(os.getenv("LOAD_SHED_POOL_WAIT_MS", "100"))
+    
+    # Profiling
+    PROFILE_ADMIN_UIDS: str = os.getenv("PROFILE_ADMIN_UIDS", "")  # comma-separated Firebase UIDs
+    PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "profiles")
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "0"))
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "false").lower() == "true"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -2,6 +2,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .load_shedding import concurrency_limiter
+import time
 
 engine = create_engine(settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -11,6 +13,10 @@ Base = declarative_base()
 def get_db():
     db = SessionLocal()
     try:
+        # Check out the connection up front so pool wait feeds the load shedder
+        started = time.perf_counter()
+        db.connection()
+        concurrency_limiter.record_pool_wait((time.perf_counter() - started) * 1000)
         yield db
     finally:
         db.close()
\ No newline at end of file
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from .database import get_db
+from .auth import get_current_active_user
+from ..models.user import User
+from ..models.household import Household
+
+@dataclass(frozen=True)
+class HouseholdContext:
+    """Household fields needed for permission and membership checks"""
+    id: UUID
+    admin_id: UUID
+    member_ids: FrozenSet[UUID]
+
+    def is_admin(self, user_id: UUID) -> bool:
+        return self.admin_id == user_id
+
+    def is_member(self, user_id: UUID) -> bool:
+        return user_id in self.member_ids
+
+def load_household_context(db: Session, household_id: UUID) -> Optional[HouseholdContext]:
+    """Resolve a household's admin and member IDs in one query.
+
+    Read fresh on every request: a cache would still need a round-trip to
+    notice membership changes made by other replicas, so it would save none.
+    """
+    rows = db.query(Household.admin_id, User.id).outerjoin(
+        User, User.household_id == Household.id
+    ).filter(Household.id == household_id).all()
+    
+    if not rows:
+        return None
+    
+    return HouseholdContext(
+        id=household_id,
+        admin_id=rows[0].admin_id,
+        member_ids=frozenset(row.id for row in rows if row.id is not None)
+    )
+
+async def get_household_context(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Optional[HouseholdContext]:
+    """Request-scoped context for the current user's household, or None without one"""
+    if not current_user.household_id:
+        return None
+    return load_household_context(db, current_user.household_id)
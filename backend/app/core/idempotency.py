@@ -0,0 +1,331 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+import hashlib
+import threading
+import time
+
+import anyio
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .auth import verify_bearer_header
+from .config import settings
+from .database import SessionLocal
+from ..models.idempotency_key import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+# Responses that are worth retrying for real rather than replaying
+TRANSIENT_STATUS_CODES = {401, 409, 429}
+
+# How often each process deletes expired keys
+SWEEP_INTERVAL_SECONDS = 300
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    fingerprint: str
+    status_code: Optional[int] = None  # None while the original request is in flight
+    content_type: Optional[str] = None
+    body: bytes = b""
+
+class IdempotencyStore(ABC):
+    """Storage for idempotency keys.
+
+    `reserve` atomically claims a key for `claim_id` and returns None, or
+    returns the existing record if the key is held and not expired. An
+    in-flight claim expires after the lease, so a retry can take over a key
+    whose request crashed; a completed claim is kept for the TTL. `complete`
+    and `release` only act on the caller's own claim.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.IDEMPOTENCY_TTL_SECONDS,
+        lease_seconds: int = settings.IDEMPOTENCY_LEASE_SECONDS
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+
+    @abstractmethod
+    def reserve(self, key: str, fingerprint: str, claim_id: str) -> Optional[IdempotencyRecord]:
+        ...
+
+    @abstractmethod
+    def complete(self, key: str, claim_id: str, status_code: int, content_type: Optional[str], body: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def release(self, key: str, claim_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Delete expired keys and return how many were removed"""
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Per-process store, for tests and single-worker deployments"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # key -> (expires_at, claim_id, record)
+        self._records: Dict[str, Tuple[float, str, IdempotencyRecord]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key, fingerprint, claim_id):
+        now = time.monotonic()
+        with self._lock:
+            existing = self._records.get(key)
+            if existing and existing[0] > now:
+                return existing[2]
+            self._records[key] = (now + self.lease_seconds, claim_id, IdempotencyRecord(fingerprint=fingerprint))
+        return None
+
+    def complete(self, key, claim_id, status_code, content_type, body):
+        with self._lock:
+            existing = self._records.get(key)
+            if existing and existing[1] == claim_id:
+                self._records[key] = (time.monotonic() + self.ttl_seconds, claim_id, IdempotencyRecord(
+                    fingerprint=existing[2].fingerprint,
+                    status_code=status_code,
+                    content_type=content_type,
+                    body=body
+                ))
+
+    def release(self, key, claim_id):
+        with self._lock:
+            existing = self._records.get(key)
+            if existing and existing[1] == claim_id:
+                del self._records[key]
+
+    def purge_expired(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (expires_at, _, _) in self._records.items() if expires_at <= now]
+            for key in expired:
+                del self._records[key]
+        return len(expired)
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """Store backed by the idempotency_keys table, shared by all workers"""
+
+    def reserve(self, key, fingerprint, claim_id):
+        now = datetime.now(timezone.utc)
+        db = SessionLocal()
+        try:
+            # An expired key is free, including an in-flight claim whose lease ran out
+            db.query(IdempotencyKey).filter(
+                IdempotencyKey.key == key,
+                IdempotencyKey.expires_at <= now
+            ).delete(synchronize_session=False)
+            db.add(IdempotencyKey(
+                key=key,
+                fingerprint=fingerprint,
+                claim_id=claim_id,
+                expires_at=now + timedelta(seconds=self.lease_seconds)
+            ))
+            try:
+                db.commit()
+                return None
+            except IntegrityError:
+                # Another request holds the key; the primary key serializes the race
+                db.rollback()
+            
+            existing = db.query(IdempotencyKey).filter(IdempotencyKey.key == key).first()
+            if not existing:
+                return IdempotencyRecord(fingerprint=fingerprint)
+            return IdempotencyRecord(
+                fingerprint=existing.fingerprint,
+                status_code=existing.status_code,
+                content_type=existing.content_type,
+                body=existing.response_body or b""
+            )
+        finally:
+            db.close()
+
+    def complete(self, key, claim_id, status_code, content_type, body):
+        db = SessionLocal()
+        try:
+            db.query(IdempotencyKey).filter(
+                IdempotencyKey.key == key,
+                IdempotencyKey.claim_id == claim_id
+            ).update({
+                IdempotencyKey.status_code: status_code,
+                IdempotencyKey.content_type: content_type,
+                IdempotencyKey.response_body: body,
+                IdempotencyKey.expires_at: datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def release(self, key, claim_id):
+        db = SessionLocal()
+        try:
+            db.query(IdempotencyKey).filter(
+                IdempotencyKey.key == key,
+                IdempotencyKey.claim_id == claim_id
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def purge_expired(self):
+        db = SessionLocal()
+        try:
+            # Served by ix_idempotency_keys_expires_at
+            deleted = db.query(IdempotencyKey).filter(
+                IdempotencyKey.expires_at <= datetime.now(timezone.utc)
+            ).delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+def create_idempotency_store() -> IdempotencyStore:
+    if settings.IDEMPOTENCY_BACKEND == "memory":
+        return MemoryIdempotencyStore()
+    if settings.IDEMPOTENCY_BACKEND == "database":
+        return DatabaseIdempotencyStore()
+    raise ValueError(f"Unknown IDEMPOTENCY_BACKEND: {settings.IDEMPOTENCY_BACKEND}")
+
+def _sha256(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+class IdempotencyMiddleware:
+    """Replay the stored response for POST requests retried with the same Idempotency-Key.
+
+    Keys are scoped to the caller's verified user ID, so they survive token
+    refreshes, and a replay never reaches the session or the domain tables.
+    Requests without a valid token pass through and fail auth as usual. A key
+    reused with a different request is rejected with 422, and a retry that
+    arrives while the original is still running gets 409 until its lease
+    expires. Server errors are not stored.
+    """
+
+    def __init__(self, app: ASGIApp, store: Optional[IdempotencyStore] = None):
+        self.app = app
+        self.store = store or create_idempotency_store()
+        self._next_sweep = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = Headers(scope=scope)
+        client_key = headers.get(IDEMPOTENCY_HEADER)
+        if not client_key:
+            await self.app(scope, receive, send)
+            return
+        
+        if len(client_key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                status_code=400,
+                content={"detail": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters"}
+            )
+            await response(scope, receive, send)
+            return
+        
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        
+        decoded_token = await run_in_threadpool(verify_bearer_header, headers.get("authorization"))
+        if not decoded_token or not decoded_token.get("uid"):
+            await self.app(scope, self._replay_body(body, receive), send)
+            return
+        
+        key = _sha256(decoded_token["uid"].encode(), client_key.encode())
+        fingerprint = _sha256(scope["path"].encode(), scope.get("query_string", b""), body)
+        claim_id = uuid4().hex
+        
+        record = await run_in_threadpool(self.store.reserve, key, fingerprint, claim_id)
+        if record is not None:
+            await self._reject_or_replay(record, fingerprint, scope, receive, send)
+            return
+        
+        response_start: Message = {}
+        response_body = []
+        
+        async def capture_send(message: Message):
+            if message["type"] == "http.response.start":
+                response_start.update(message)
+            elif message["type"] == "http.response.body":
+                response_body.append(message.get("body", b""))
+            await send(message)
+        
+        try:
+            await self.app(scope, self._replay_body(body, receive), capture_send)
+        except BaseException:
+            # Includes cancellation on client disconnect; shield the cleanup from it
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(self.store.release, key, claim_id)
+            raise
+        
+        status_code = response_start.get("status", 500)
+        if status_code >= 500 or status_code in TRANSIENT_STATUS_CODES:
+            await run_in_threadpool(self.store.release, key, claim_id)
+        else:
+            content_type = Headers(raw=response_start.get("headers", [])).get("content-type")
+            await run_in_threadpool(
+                self.store.complete, key, claim_id, status_code, content_type, b"".join(response_body)
+            )
+        
+        await self._sweep()
+
+    @staticmethod
+    def _replay_body(body: bytes, receive: Receive) -> Receive:
+        """Hand the already-read request body to the app"""
+        body_sent = False
+        
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        
+        return replay_receive
+
+    async def _sweep(self):
+        """Delete expired keys at most once per SWEEP_INTERVAL_SECONDS per process"""
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + SWEEP_INTERVAL_SECONDS
+        await run_in_threadpool(self.store.purge_expired)
+
+    async def _reject_or_replay(self, record, fingerprint, scope, receive, send):
+        if record.fingerprint != fingerprint:
+            response = JSONResponse(
+                status_code=422,
+                content={"detail": f"{IDEMPOTENCY_HEADER} was already used for a different request"}
+            )
+        elif record.status_code is None:
+            response = JSONResponse(
+                status_code=409,
+                content={"detail": f"A request with this {IDEMPOTENCY_HEADER} is still in progress"},
+                headers={"Retry-After": "1"}
+            )
+        else:
+            response = Response(
+                content=record.body,
+                status_code=record.status_code,
+                media_type=record.content_type,
+                headers={"Idempotent-Replayed": "true"}
+            )
+        await response(scope, receive, send)
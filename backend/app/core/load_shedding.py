@@ -0,0 +1,76 @@
+import threading
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+from .metrics import increment, set_gauge
+
+# Weight of the newest sample in the pool wait moving average
+POOL_WAIT_SMOOTHING = 0.2
+
+class ConcurrencyLimiter:
+    """Adaptive in-flight request limit (AIMD).
+
+    The limit shrinks by 10% whenever the smoothed DB pool wait exceeds
+    LOAD_SHED_POOL_WAIT_MS and grows by one request otherwise, bounded by
+    LOAD_SHED_MIN_IN_FLIGHT and LOAD_SHED_MAX_IN_FLIGHT.
+    """
+
+    def __init__(self):
+        self.limit = float(settings.LOAD_SHED_MAX_IN_FLIGHT)
+        self.in_flight = 0
+        self.pool_wait_ms = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            set_gauge("chorrus_requests_in_flight", self.in_flight)
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            set_gauge("chorrus_requests_in_flight", self.in_flight)
+
+    def record_pool_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.pool_wait_ms += POOL_WAIT_SMOOTHING * (wait_ms - self.pool_wait_ms)
+            if self.pool_wait_ms > settings.LOAD_SHED_POOL_WAIT_MS:
+                self.limit = max(settings.LOAD_SHED_MIN_IN_FLIGHT, self.limit * 0.9)
+            else:
+                self.limit = min(settings.LOAD_SHED_MAX_IN_FLIGHT, self.limit + 1)
+            set_gauge("chorrus_db_pool_wait_ms", round(self.pool_wait_ms, 3))
+            set_gauge("chorrus_concurrency_limit", int(self.limit))
+
+concurrency_limiter = ConcurrencyLimiter()
+
+class LoadSheddingMiddleware:
+    """Reject API requests with 503 once the adaptive concurrency limit is reached"""
+
+    def __init__(self, app: ASGIApp, limiter: ConcurrencyLimiter = concurrency_limiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith(settings.API_V1_STR):
+            await self.app(scope, receive, send)
+            return
+        
+        if not self.limiter.try_acquire():
+            increment("chorrus_requests_shed_total")
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is overloaded, please retry"},
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release()
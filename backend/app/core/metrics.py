@@ -0,0 +1,30 @@
+from collections import defaultdict
+from typing import Dict, Tuple
+import threading
+
+# (metric name, sorted label pairs) -> value
+_counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = defaultdict(float)
+_gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+_lock = threading.Lock()
+
+def increment(name: str, amount: float = 1, **labels: str) -> None:
+    with _lock:
+        _counters[(name, tuple(sorted(labels.items())))] += amount
+
+def set_gauge(name: str, value: float, **labels: str) -> None:
+    with _lock:
+        _gauges[(name, tuple(sorted(labels.items())))] = value
+
+def render_prometheus() -> str:
+    """Render all metrics in the Prometheus text exposition format"""
+    lines = []
+    with _lock:
+        for kind, values in (("counter", _counters), ("gauge", _gauges)):
+            seen = set()
+            for (name, labels), value in sorted(values.items()):
+                if name not in seen:
+                    lines.append(f"# TYPE {name} {kind}")
+                    seen.add(name)
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels)
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,169 @@
+import cProfile
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import List, Optional
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from .auth import verify_bearer_header
+from .config import settings
+
+logger = logging.getLogger("chorrus.sql")
+
+PROFILE_HEADER = "X-Profile"
+
+# SQL statements captured for the request currently being profiled, if any
+_captured_queries: ContextVar[Optional[List[dict]]] = ContextVar("captured_queries", default=None)
+
+# cProfile hooks the interpreter globally, so only one request is profiled at a time
+_profiler_lock = threading.Lock()
+
+def _profile_admin_uids() -> set:
+    return {uid.strip() for uid in settings.PROFILE_ADMIN_UIDS.split(",") if uid.strip()}
+
+async def _should_profile(request: Request) -> bool:
+    if request.headers.get(PROFILE_HEADER) == "1":
+        admin_uids = _profile_admin_uids()
+        if admin_uids:
+            # Verification may fetch Firebase certificates; keep it off the event loop
+            decoded_token = await run_in_threadpool(verify_bearer_header, request.headers.get("Authorization"))
+            if decoded_token and decoded_token.get("uid") in admin_uids:
+                return True
+    return settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """Opt-in per-request profiler.
+
+    A request is profiled when it sends ``X-Profile: 1`` with a Firebase token
+    whose UID is listed in ``PROFILE_ADMIN_UIDS``, or is picked by
+    ``PROFILE_SAMPLE_RATE``. The call-stack profile is written to
+    ``PROFILE_DIR`` in pstats format (readable with ``pstats``/snakeviz), next
+    to a JSON file listing every SQL statement and its timing.
+
+    Scope: cProfile records the event-loop thread while the request is in
+    flight, so the call-stack profile also contains whatever other requests'
+    coroutines ran during its awaits, and misses work done in the threadpool
+    (sync dependencies such as ``get_db``, ``run_in_threadpool`` calls). Read it
+    on a quiet instance. The SQL capture is per request: it follows the
+    request's context, including into the threadpool, and nothing else.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if not await _should_profile(request) or not _profiler_lock.acquire(blocking=False):
+            return await call_next(request)
+        
+        profile_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid4().hex[:8]}"
+        queries: List[dict] = []
+        token = _captured_queries.set(queries)
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.disable()
+        finally:
+            _captured_queries.reset(token)
+            _profiler_lock.release()
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _write_profile(profile_id, request, response.status_code, elapsed_ms, profiler, queries)
+        response.headers["X-Profile-Id"] = profile_id
+        return response
+
+def _write_profile(profile_id, request, status_code, elapsed_ms, profiler, queries):
+    try:
+        os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+        base = os.path.join(settings.PROFILE_DIR, profile_id)
+        profiler.dump_stats(f"{base}.prof")
+        with open(f"{base}.sql.json", "w") as f:
+            json.dump({
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": status_code,
+                "duration_ms": round(elapsed_ms, 3),
+                "profile_scope": "event-loop thread; may include concurrent requests, excludes threadpool work",
+                "query_count": len(queries),
+                "query_time_ms": round(sum(q["duration_ms"] for q in queries), 3),
+                "queries": queries,
+            }, f, indent=2, default=str)
+    except OSError:
+        logger.exception("Failed to write profile %s", profile_id)
+
+def _explain(conn, statement, parameters) -> Optional[str]:
+    """Return the query plan for a slow SELECT on a separate DBAPI cursor.
+
+    On PostgreSQL the EXPLAIN runs inside a savepoint, so a failure (e.g. a
+    statement_timeout while ANALYZE re-runs the query) does not abort the
+    request's transaction.
+    """
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if settings.SLOW_QUERY_EXPLAIN_ANALYZE else "EXPLAIN "
+    elif dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        return None
+    
+    use_savepoint = dialect == "postgresql"
+    cursor = conn.connection.cursor()
+    try:
+        if use_savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        cursor.execute(prefix + statement, parameters)
+        plan = "\n".join(" ".join(str(col) for col in row) for row in cursor.fetchall())
+        if use_savepoint:
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    except Exception:
+        logger.debug("EXPLAIN failed for slow query", exc_info=True)
+        if use_savepoint:
+            try:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            except Exception:
+                logger.debug("Rolling back the EXPLAIN savepoint failed", exc_info=True)
+        return None
+    finally:
+        cursor.close()
+
+def install_query_listeners(engine: Engine) -> None:
+    """Hook SQL timing into the engine for profiling and the slow-query log."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        
+        queries = _captured_queries.get()
+        if queries is not None:
+            queries.append({
+                "statement": statement,
+                "parameters": parameters,
+                "duration_ms": round(elapsed_ms, 3),
+            })
+        
+        threshold = settings.SLOW_QUERY_THRESHOLD_MS
+        if threshold > 0 and elapsed_ms >= threshold and not executemany:
+            plan = _explain(conn, statement, parameters)
+            logger.warning(
+                "Slow query (%.1f ms): %s\nParameters: %r\nPlan:\n%s",
+                elapsed_ms, statement, parameters, plan or "(not available)"
+            )
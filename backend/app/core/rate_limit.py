@@ -0,0 +1,126 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+import math
+import threading
+import time
+
+import redis
+from fastapi import Depends, HTTPException, status
+
+from .config import settings
+from .auth import verify_firebase_token, get_current_active_user
+from .metrics import increment
+from ..models.user import User
+
+class RateLimitBackend(ABC):
+    """Token-bucket storage.
+
+    `take` removes one token from the bucket at `key` and returns None, or
+    returns the seconds until a token is available if the bucket is empty.
+    """
+
+    @abstractmethod
+    def take(self, key: str, rate: float, capacity: int) -> Optional[float]:
+        ...
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets.
+
+    Every worker process and replica keeps its own buckets, so a deployment
+    of N processes admits up to N times the configured rates and bursts. Use
+    the Redis backend to enforce the limits across replicas.
+    """
+
+    MAX_BUCKETS = 10000
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, capacity):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                retry_after = None
+            else:
+                self._buckets[key] = (tokens, now)
+                retry_after = (1 - tokens) / rate
+            if len(self._buckets) > self.MAX_BUCKETS:
+                self._prune(now)
+        return retry_after
+
+    def _prune(self, now: float) -> None:
+        # Buckets idle for a minute have refilled for any sane rate; forgetting them is free
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items() if now - bucket[1] < 60
+        }
+
+_REDIS_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry_after)
+"""
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets shared by all workers, updated atomically by a Lua script"""
+
+    def __init__(self, url: str = settings.REDIS_URL):
+        self._client = redis.Redis.from_url(url)
+        self._take = self._client.register_script(_REDIS_TAKE_SCRIPT)
+
+    def take(self, key, rate, capacity):
+        retry_after = float(self._take(keys=[f"ratelimit:{key}"], args=[rate, capacity, time.time()]))
+        return retry_after or None
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimitBackend()
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend()
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {settings.RATE_LIMIT_BACKEND}")
+
+rate_limit_backend = create_rate_limit_backend()
+
+def _enforce(scope: str, key: str, rate: float, capacity: int) -> None:
+    retry_after = rate_limit_backend.take(f"{scope}:{key}", rate, capacity)
+    if retry_after is not None:
+        increment("chorrus_requests_throttled_total", scope=scope)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+def limit_user_requests(decoded_token: dict = Depends(verify_firebase_token)) -> None:
+    """Per-user token bucket keyed on the verified Firebase UID, checked before any DB access"""
+    uid = decoded_token.get("uid")
+    if uid:
+        _enforce("user", uid, settings.RATE_LIMIT_USER_PER_SECOND, settings.RATE_LIMIT_USER_BURST)
+
+def limit_household_requests(current_user: User = Depends(get_current_active_user)) -> None:
+    """Per-household token bucket shared by all members"""
+    if current_user.household_id:
+        _enforce(
+            "household",
+            str(current_user.household_id),
+            settings.RATE_LIMIT_HOUSEHOLD_PER_SECOND,
+            settings.RATE_LIMIT_HOUSEHOLD_BURST
+        )
+
+rate_limits = [Depends(limit_user_requests), Depends(limit_household_requests)]
@@ -1,12 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
 from .core.database import engine
-from .models import Base
-from .routers import households, chores
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+from .core.profiling import ProfilingMiddleware, install_query_listeners
+from .core.idempotency import IdempotencyMiddleware
+from .core.load_shedding import LoadSheddingMiddleware
+from .core.metrics import render_prometheus
+from .core.rate_limit import rate_limits
+from .routers import households, chores, dashboard, calendar
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -14,6 +16,17 @@ app = FastAPI(
     description="Chorrus - Household Task Manager API"
 )
 
+# SQL timing for request profiles and the slow-query log
+install_query_listeners(engine)
+
+app.add_middleware(ProfilingMiddleware)
+
+# Replay responses for retried POSTs carrying an Idempotency-Key
+app.add_middleware(IdempotencyMiddleware)
+
+# Shed load before requests reach auth or the DB pool
+app.add_middleware(LoadSheddingMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -21,11 +34,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Response headers the frontend reads: paging cursor, throttling, replays
+    expose_headers=["X-Next-Cursor", "Retry-After", "Idempotent-Replayed"],
 )
 
 # Include routers
-app.include_router(households.router, prefix="/api/v1")
-app.include_router(chores.router, prefix="/api/v1")
+app.include_router(households.router, prefix="/api/v1", dependencies=rate_limits)
+app.include_router(chores.router, prefix="/api/v1", dependencies=rate_limits)
+app.include_router(dashboard.router, prefix="/api/v1", dependencies=rate_limits)
+# Feeds are polled by calendar apps with URL tokens, not Firebase credentials
+app.include_router(calendar.router, prefix="/api/v1")
 
 @app.get("/")
 async def root():
@@ -35,6 +53,10 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return render_prometheus()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -2,6 +2,8 @@ from .user import User
 from .household import Household
 from .chore import Chore
 from .chore_assignment import ChoreAssignment
+from .chore_tombstone import ChoreTombstone
+from .idempotency_key import IdempotencyKey
 from ..core.database import Base
 
-__all__ = ["User", "Household", "Chore", "ChoreAssignment", "Base"]
\ No newline at end of file
+__all__ = ["User", "Household", "Chore", "ChoreAssignment", "ChoreTombstone", "IdempotencyKey", "Base"]
\ No newline at end of file
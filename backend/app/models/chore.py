@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, UUID, Boolean, Text, Date
+from sqlalchemy import Column, String, DateTime, ForeignKey, Uuid, Boolean, Text, Date, BigInteger, Index, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -6,17 +6,38 @@ from ..core.database import Base
 
 class Chore(Base):
     __tablename__ = "chores"
+    __table_args__ = (
+        Index("ix_chores_household_id_change_seq", "household_id", "change_seq"),
+        Index("ix_chores_household_id_due_date_id", "household_id", "due_date", "id"),
+        # Trigram indexes back ILIKE text search on PostgreSQL; other
+        # databases have no equivalent and scan the household's chores
+        Index(
+            "ix_chores_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_chores_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    household_id = Column(UUID(as_uuid=True), ForeignKey("households.id"), nullable=False)
-    created_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
+    household_id = Column(Uuid(as_uuid=True), ForeignKey("households.id"), nullable=False)
+    created_by_id = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     due_date = Column(Date, nullable=False)
     is_recurring = Column(Boolean, default=False)
     recurrence_interval = Column(String, nullable=True)  # daily, weekly, bi-weekly
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     household = relationship("Household", back_populates="chores")
     created_by = relationship("User", back_populates="created_chores")
-    assignments = relationship("ChoreAssignment", back_populates="chore")
\ No newline at end of file
+    assignments = relationship("ChoreAssignment", back_populates="chore")
+
+event.listen(
+    Chore.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
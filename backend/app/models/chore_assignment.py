@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Uuid, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -6,10 +6,13 @@ from ..core.database import Base
 
 class ChoreAssignment(Base):
     __tablename__ = "chore_assignments"
+    __table_args__ = (
+        Index("ix_chore_assignments_user_id_status", "user_id", "status"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    chore_id = Column(UUID(as_uuid=True), ForeignKey("chores.id"), nullable=False)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
+    chore_id = Column(Uuid(as_uuid=True), ForeignKey("chores.id"), nullable=False, index=True)
+    user_id = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=False)
     status = Column(String, default="pending")  # pending, completed
     completed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
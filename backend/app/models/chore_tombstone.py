@@ -0,0 +1,17 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Uuid, BigInteger, Index
+from sqlalchemy.sql import func
+from uuid import uuid4
+from ..core.database import Base
+
+class ChoreTombstone(Base):
+    """Records a deleted chore so the change feed can report it"""
+    __tablename__ = "chore_tombstones"
+    __table_args__ = (
+        Index("ix_chore_tombstones_household_id_change_seq", "household_id", "change_seq"),
+    )
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
+    household_id = Column(Uuid(as_uuid=True), ForeignKey("households.id"), nullable=False)
+    chore_id = Column(Uuid(as_uuid=True), nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
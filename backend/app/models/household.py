@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, UUID, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Uuid, Boolean, BigInteger
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -7,12 +7,13 @@ from ..core.database import Base
 class Household(Base):
     __tablename__ = "households"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String, nullable=False)
-    admin_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    admin_id = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=False)
     invite_code = Column(String, unique=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")  # bumped on every chore change
 
-    members = relationship("User", back_populates="household")
+    members = relationship("User", back_populates="household", foreign_keys="User.household_id")
     admin = relationship("User", foreign_keys=[admin_id])
     chores = relationship("Chore", back_populates="household")
\ No newline at end of file
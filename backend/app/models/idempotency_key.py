@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime, Integer, LargeBinary
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class IdempotencyKey(Base):
+    """Stored outcome of a POST request made with an Idempotency-Key header"""
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String, primary_key=True)  # sha256 of user ID and client key
+    fingerprint = Column(String, nullable=False)  # sha256 of path, query string and body
+    claim_id = Column(String, nullable=True)  # request that holds the key
+    status_code = Column(Integer, nullable=True)  # NULL while the request is in flight
+    content_type = Column(String, nullable=True)
+    response_body = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # lease end while in flight
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -7,13 +7,13 @@ from ..core.database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
     firebase_uid = Column(String, unique=True, nullable=False, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
     display_name = Column(String, nullable=True)
-    household_id = Column(UUID(as_uuid=True), ForeignKey("households.id"), nullable=True)
+    household_id = Column(Uuid(as_uuid=True), ForeignKey("households.id"), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    household = relationship("Household", back_populates="members")
+    household = relationship("Household", back_populates="members", foreign_keys=[household_id])
     created_chores = relationship("Chore", back_populates="created_by")
     chore_assignments = relationship("ChoreAssignment", back_populates="user")
\ No newline at end of file
@@ -0,0 +1,168 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterator
+from uuid import UUID
+
+from ..core.database import SessionLocal
+from ..core.auth import get_current_active_user
+from ..core.rate_limit import rate_limits
+from ..core.calendar_feed import (
+    FEED_KINDS,
+    calendar_cache,
+    create_feed_token,
+    verify_feed_token,
+    render_calendar
+)
+from ..models.user import User
+from ..models.household import Household
+from ..models.chore import Chore
+from ..models.chore_assignment import ChoreAssignment
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+ICS_MEDIA_TYPE = "text/calendar"
+
+# Rows fetched per server-side cursor round-trip while rendering a feed
+FEED_BATCH_SIZE = 500
+
+@router.get("/links", response_model=dict, dependencies=rate_limits)
+async def get_calendar_links(
+    request: Request,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get subscription URLs for the household and "my chores" calendar feeds"""
+    if not current_user.household_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User must belong to a household to subscribe to calendars"
+        )
+    
+    return {
+        kind: str(request.url_for(
+            "get_calendar_feed",
+            kind=kind,
+            token=create_feed_token(kind, current_user.id, current_user.household_id)
+        ))
+        for kind in FEED_KINDS
+    }
+
+def _not_modified(request: Request, etag: str, last_modified) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag in (tag.strip() for tag in if_none_match.split(","))
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return last_modified.replace(microsecond=0) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    
+    return False
+
+def _feed_statement(kind: str, user_id: UUID, household_id: UUID):
+    statement = select(
+        Chore.id, Chore.title, Chore.description, Chore.due_date, Chore.recurrence_interval
+    ).where(Chore.household_id == household_id)
+    
+    if kind == "mine":
+        statement = statement.where(
+            select(ChoreAssignment.id).where(
+                ChoreAssignment.chore_id == Chore.id,
+                ChoreAssignment.user_id == user_id,
+                ChoreAssignment.status == "pending"
+            ).exists()
+        )
+    
+    return statement.order_by(Chore.due_date, Chore.id).execution_options(yield_per=FEED_BATCH_SIZE)
+
+@router.get("/{kind}/{token}.ics", name="get_calendar_feed")
+async def get_calendar_feed(
+    kind: str,
+    token: str,
+    request: Request
+):
+    """iCalendar subscription feed, authenticated by its URL token.
+
+    Polls are answered from the subscriber's cached feed without touching the
+    database; a miss checks membership and the household's change sequence,
+    then streams the feed while caching it, or answers a matching conditional
+    poll with 304 and caches just the validator. Membership changes drop the
+    household's cached feeds, so a removed member's next poll is a miss.
+    """
+    verified = verify_feed_token(kind, token) if kind in FEED_KINDS else None
+    if not verified:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Calendar feed not found"
+        )
+    
+    user_id, household_id = verified
+    cache_key = (kind, user_id, household_id)
+    
+    cached = calendar_cache.get(cache_key)
+    if cached:
+        headers = {
+            "ETag": cached.etag,
+            "Last-Modified": format_datetime(cached.last_modified, usegmt=True)
+        }
+        if _not_modified(request, cached.etag, cached.last_modified):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if cached.body is not None:
+            return Response(content=cached.body, media_type=ICS_MEDIA_TYPE, headers=headers)
+    
+    generation = calendar_cache.generation(household_id)
+    db: Session = SessionLocal()
+    try:
+        household = db.query(Household.name, Household.change_seq).join(
+            User, User.household_id == Household.id
+        ).filter(Household.id == household_id, User.id == user_id).first()
+    finally:
+        db.close()
+    
+    # The token outlives membership; a former member gets nothing
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Calendar feed not found"
+        )
+    
+    etag = f'"{kind}-{household_id.hex}-{household.change_seq}"'
+    last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+    if _not_modified(request, etag, None):
+        # Calendar apps mostly poll conditionally; remember the validator so
+        # the next conditional poll is answered without the database
+        calendar_cache.put(cache_key, generation, etag, last_modified, None)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    name = household.name if kind == "household" else f"{household.name} - My chores"
+    
+    def stream() -> Iterator[bytes]:
+        chunks = []
+        feed_db = SessionLocal()
+        try:
+            rows = (
+                row
+                for partition in feed_db.execute(_feed_statement(kind, user_id, household_id)).partitions()
+                for row in partition
+            )
+            for text in render_calendar(name, rows, last_modified):
+                chunk = text.encode()
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            feed_db.close()
+        calendar_cache.put(cache_key, generation, etag, last_modified, b"".join(chunks))
+    
+    return StreamingResponse(
+        stream(),
+        media_type=ICS_MEDIA_TYPE,
+        headers={
+            "ETag": etag,
+            "Last-Modified": format_datetime(last_modified, usegmt=True)
+        }
+    )
@@ -1,40 +1,113 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import exists, or_, tuple_
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Union
+from datetime import date, datetime
 
 from ..core.database import get_db
 from ..core.auth import get_current_active_user
+from ..core.household_context import HouseholdContext, get_household_context
+from ..core.change_feed import (
+    touch_chore,
+    record_chore_deleted,
+    encode_sync_token,
+    decode_sync_token
+)
 from ..models.user import User
 from ..models.household import Household
 from ..models.chore import Chore
 from ..models.chore_assignment import ChoreAssignment
+from ..models.chore_tombstone import ChoreTombstone
 from ..schemas.chore import (
     ChoreCreate,
     ChoreResponse,
     ChoreWithAssignments,
+    ChoreSummary,
+    ChoreFields,
+    ChoreChanges,
     ChoreUpdate
 )
 from ..schemas.chore_assignment import ChoreAssignmentResponse
 
 router = APIRouter(prefix="/chores", tags=["chores"])
 
+ChoreListResponse = Union[List[ChoreWithAssignments], List[ChoreSummary], List[ChoreFields]]
+
+# Columns that can be requested through the `fields` parameter
+CHORE_FIELD_COLUMNS = {
+    "id": Chore.id,
+    "title": Chore.title,
+    "description": Chore.description,
+    "due_date": Chore.due_date,
+    "is_recurring": Chore.is_recurring,
+    "recurrence_interval": Chore.recurrence_interval,
+    "created_by_id": Chore.created_by_id,
+    "created_at": Chore.created_at,
+}
+
+SUMMARY_FIELDS = ["id", "title", "due_date", "is_pending"]
+
+def _requested_fields(view: str, fields: Optional[str]) -> Optional[List[str]]:
+    """Resolve `view`/`fields` into the column names to select, or None for the full view"""
+    if fields:
+        requested = ["id"]
+        for name in (part.strip() for part in fields.split(",")):
+            if name and name not in requested:
+                requested.append(name)
+        unknown = [name for name in requested if name not in CHORE_FIELD_COLUMNS and name != "is_pending"]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown chore fields: {', '.join(unknown)}"
+            )
+        return requested
+    
+    if view == "summary":
+        return SUMMARY_FIELDS
+    
+    return None
+
+MAX_PAGE_SIZE = 200
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _encode_cursor(due_date: date, chore_id: UUID) -> str:
+    return f"{due_date.isoformat()}.{chore_id.hex}"
+
+def _decode_cursor(cursor: str):
+    try:
+        due_date, chore_hex = cursor.split(".", 1)
+        return date.fromisoformat(due_date), UUID(hex=chore_hex)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def _field_columns(field_names: List[str], is_pending):
+    return [
+        is_pending.label(name) if name == "is_pending" else CHORE_FIELD_COLUMNS[name].label(name)
+        for name in field_names
+    ]
+
 @router.post("/", response_model=ChoreResponse)
 async def create_chore(
     chore: ChoreCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
 ):
     """Create a new chore"""
-    if not current_user.household_id:
+    if not household:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User must belong to a household to create chores"
         )
     
     db_chore = Chore(
-        household_id=current_user.household_id,
+        household_id=household.id,
         created_by_id=current_user.id,
         title=chore.title,
         description=chore.description,
@@ -42,63 +115,125 @@ async def create_chore(
         is_recurring=chore.is_recurring,
         recurrence_interval=chore.recurrence_interval
     )
+    touch_chore(db, db_chore)
     
     db.add(db_chore)
-    db.commit()
-    db.refresh(db_chore)
+    db.flush()
     
-    # Assign users if provided
+    # Assign users if provided, skipping anyone outside the household
     if chore.assigned_user_ids:
-        for user_id in chore.assigned_user_ids:
-            user = db.query(User).filter(
-                User.id == user_id,
-                User.household_id == current_user.household_id
-            ).first()
-            
-            if user:
-                assignment = ChoreAssignment(
-                    chore_id=db_chore.id,
-                    user_id=user_id
-                )
-                db.add(assignment)
-        
-        db.commit()
+        for user_id in dict.fromkeys(chore.assigned_user_ids):
+            if household.is_member(user_id):
+                db.add(ChoreAssignment(chore_id=db_chore.id, user_id=user_id))
+    
+    db.commit()
+    db.refresh(db_chore)
     
     return db_chore
 
-@router.get("/", response_model=List[ChoreWithAssignments])
+@router.get("/", response_model=ChoreListResponse, response_model_exclude_unset=True)
 async def get_chores(
+    response: Response,
     household_id: Optional[UUID] = None,
     include_completed: bool = True,
+    view: str = Query("full", pattern="^(full|summary)$"),
+    fields: Optional[str] = None,
+    q: Optional[str] = Query(None, min_length=1, max_length=100),
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    assignee_id: Optional[UUID] = None,
+    chore_status: Optional[str] = Query(None, alias="status", pattern="^(pending|completed)$"),
+    is_recurring: Optional[bool] = None,
+    recurrence_interval: Optional[str] = Query(None, pattern="^(daily|weekly|bi-weekly)$"),
+    after: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get chores for current user's household"""
+    """Get chores for current user's household.
+
+    Results are ordered by (due_date, id). When `limit` is given, the
+    `X-Next-Cursor` response header holds the `after` value for the next page.
+    """
     if not current_user.household_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User must belong to a household to view chores"
         )
     
-    query = db.query(Chore).filter(Chore.household_id == current_user.household_id)
+    is_pending = exists().where(
+        ChoreAssignment.chore_id == Chore.id,
+        ChoreAssignment.status == "pending"
+    )
     
+    filters = [Chore.household_id == current_user.household_id]
     if not include_completed:
-        # Only get chores with pending assignments
-        query = query.join(ChoreAssignment).filter(ChoreAssignment.status == "pending")
-    
-    chores = query.order_by(Chore.due_date).all()
-    
-    # Load assignments for each chore
-    for chore in chores:
-        chore.assignments = db.query(ChoreAssignment).filter(
-            ChoreAssignment.chore_id == chore.id
-        ).all()
-    
-    return chores
+        filters.append(is_pending)
+    if q:
+        pattern = f"%{_escape_like(q)}%"
+        filters.append(or_(
+            Chore.title.ilike(pattern, escape="\\"),
+            Chore.description.ilike(pattern, escape="\\")
+        ))
+    if due_from:
+        filters.append(Chore.due_date >= due_from)
+    if due_to:
+        filters.append(Chore.due_date <= due_to)
+    if is_recurring is not None:
+        filters.append(Chore.is_recurring == is_recurring)
+    if recurrence_interval:
+        filters.append(Chore.recurrence_interval == recurrence_interval)
+    if assignee_id:
+        assigned = [ChoreAssignment.chore_id == Chore.id, ChoreAssignment.user_id == assignee_id]
+        if chore_status:
+            assigned.append(ChoreAssignment.status == chore_status)
+        filters.append(exists().where(*assigned))
+    elif chore_status == "pending":
+        filters.append(is_pending)
+    elif chore_status == "completed":
+        filters.append(exists().where(ChoreAssignment.chore_id == Chore.id))
+        filters.append(~is_pending)
+    if after:
+        cursor = _decode_cursor(after)
+        filters.append(tuple_(Chore.due_date, Chore.id) > tuple_(*cursor))
+    
+    field_names = _requested_fields(view, fields)
+    if field_names is not None:
+        # Select only the requested columns and never load assignments
+        columns = _field_columns(field_names, is_pending)
+        if "due_date" not in field_names:
+            columns.append(Chore.due_date.label("_due_date"))
+        query = db.query(*columns)
+    else:
+        query = db.query(Chore).options(selectinload(Chore.assignments))
+    
+    query = query.filter(*filters).order_by(Chore.due_date, Chore.id)
+    if limit:
+        query = query.limit(limit)
+    results = query.all()
+    
+    if limit and len(results) == limit:
+        last = results[-1]
+        if field_names is not None:
+            last = last._asdict()
+            last_due_date = last.get("due_date", last.get("_due_date"))
+            response.headers["X-Next-Cursor"] = _encode_cursor(last_due_date, last["id"])
+        else:
+            response.headers["X-Next-Cursor"] = _encode_cursor(last.due_date, last.id)
+    
+    if field_names is not None:
+        return [
+            {key: value for key, value in row._asdict().items() if key != "_due_date"}
+            for row in results
+        ]
+    
+    return results
 
-@router.get("/my-chores", response_model=List[ChoreWithAssignments])
+@router.get("/my-chores", response_model=ChoreListResponse, response_model_exclude_unset=True)
 async def get_my_chores(
     include_completed: bool = False,
+    view: str = Query("full", pattern="^(full|summary)$"),
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -109,6 +244,21 @@ async def get_my_chores(
             detail="User must belong to a household to view chores"
         )
     
+    field_names = _requested_fields(view, fields)
+    if field_names is not None:
+        # Pending here means the current user's own assignment is pending
+        is_pending = ChoreAssignment.status == "pending"
+        query = db.query(*_field_columns(field_names, is_pending)).join(
+            ChoreAssignment, ChoreAssignment.chore_id == Chore.id
+        ).filter(
+            ChoreAssignment.user_id == current_user.id,
+            Chore.household_id == current_user.household_id
+        )
+        if not include_completed:
+            query = query.filter(is_pending)
+        
+        return [row._asdict() for row in query.order_by(Chore.due_date).all()]
+    
     query = db.query(Chore).join(ChoreAssignment).filter(
         ChoreAssignment.user_id == current_user.id,
         Chore.household_id == current_user.household_id
@@ -127,6 +277,58 @@ async def get_my_chores(
     
     return chores
 
+@router.get("/changes", response_model=ChoreChanges)
+async def get_chore_changes(
+    since: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get chores changed or deleted since a sync token.
+
+    Without a token (or with one from another household) a full snapshot is
+    returned with `reset` set. Each changed chore carries all of its current
+    assignments, so assignment changes surface as chore changes.
+    """
+    if not current_user.household_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User must belong to a household to view chores"
+        )
+    
+    household_id = current_user.household_id
+    decoded = decode_sync_token(since) if since else None
+    if since and decoded is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token"
+        )
+    
+    current_seq = db.query(Household.change_seq).filter(Household.id == household_id).scalar()
+    reset = decoded is None or decoded[0] != household_id or decoded[1] > current_seq
+    
+    query = db.query(Chore).options(selectinload(Chore.assignments)).filter(
+        Chore.household_id == household_id,
+        Chore.change_seq <= current_seq
+    )
+    deleted_chore_ids = []
+    if not reset:
+        since_seq = decoded[1]
+        query = query.filter(Chore.change_seq > since_seq)
+        deleted_chore_ids = [
+            row.chore_id for row in db.query(ChoreTombstone.chore_id).filter(
+                ChoreTombstone.household_id == household_id,
+                ChoreTombstone.change_seq > since_seq,
+                ChoreTombstone.change_seq <= current_seq
+            )
+        ]
+    
+    return {
+        "chores": query.order_by(Chore.change_seq).all(),
+        "deleted_chore_ids": deleted_chore_ids,
+        "next_token": encode_sync_token(household_id, current_seq),
+        "reset": reset
+    }
+
 @router.get("/{chore_id}", response_model=ChoreWithAssignments)
 async def get_chore(
     chore_id: UUID,
@@ -163,10 +365,11 @@ async def update_chore(
     chore_id: UUID,
     chore_update: ChoreUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
 ):
     """Update chore details"""
-    if not current_user.household_id:
+    if not household:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User must belong to a household to update chores"
@@ -174,7 +377,7 @@ async def update_chore(
     
     chore = db.query(Chore).filter(
         Chore.id == chore_id,
-        Chore.household_id == current_user.household_id
+        Chore.household_id == household.id
     ).first()
     
     if not chore:
@@ -184,8 +387,7 @@ async def update_chore(
         )
     
     # Check if user has permission (creator or admin)
-    household = db.query(Household).filter(Household.id == current_user.household_id).first()
-    if chore.created_by_id != current_user.id and household.admin_id != current_user.id:
+    if chore.created_by_id != current_user.id and not household.is_admin(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only chore creator or household admin can update chore"
@@ -194,6 +396,7 @@ async def update_chore(
     update_data = chore_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(chore, field, value)
+    touch_chore(db, chore)
     
     db.commit()
     db.refresh(chore)
@@ -204,10 +407,11 @@ async def update_chore(
 async def delete_chore(
     chore_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
 ):
     """Delete a chore"""
-    if not current_user.household_id:
+    if not household:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User must belong to a household to delete chores"
@@ -215,7 +419,7 @@ async def delete_chore(
     
     chore = db.query(Chore).filter(
         Chore.id == chore_id,
-        Chore.household_id == current_user.household_id
+        Chore.household_id == household.id
     ).first()
     
     if not chore:
@@ -225,8 +429,7 @@ async def delete_chore(
         )
     
     # Check if user has permission (creator or admin)
-    household = db.query(Household).filter(Household.id == current_user.household_id).first()
-    if chore.created_by_id != current_user.id and household.admin_id != current_user.id:
+    if chore.created_by_id != current_user.id and not household.is_admin(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only chore creator or household admin can delete chore"
@@ -235,7 +438,8 @@ async def delete_chore(
     # Delete assignments first
     db.query(ChoreAssignment).filter(ChoreAssignment.chore_id == chore_id).delete()
     
-    # Delete chore
+    # Delete chore, leaving a tombstone for the change feed
+    record_chore_deleted(db, chore)
     db.delete(chore)
     db.commit()
     
@@ -268,6 +472,7 @@ async def mark_chore_complete(
     
     assignment.status = "completed"
     assignment.completed_at = datetime.utcnow()
+    touch_chore(db, assignment.chore)
     
     db.commit()
     db.refresh(assignment)
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session, selectinload
+
+from ..core.database import get_db
+from ..core.auth import get_current_active_user
+from ..models.user import User
+from ..models.household import Household
+from ..models.chore import Chore
+from ..schemas.dashboard import DashboardResponse
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get household, members and chores for the home screen in one round-trip"""
+    if not current_user.household_id:
+        return DashboardResponse()
+    
+    household = db.query(Household).options(
+        selectinload(Household.members)
+    ).filter(Household.id == current_user.household_id).first()
+    
+    household_chores = db.query(Chore).options(
+        selectinload(Chore.assignments)
+    ).filter(
+        Chore.household_id == current_user.household_id
+    ).order_by(Chore.due_date).all()
+    
+    # My pending chores are a subset of the household chores already loaded
+    my_chores = [
+        chore for chore in household_chores
+        if any(
+            assignment.user_id == current_user.id and assignment.status == "pending"
+            for assignment in chore.assignments
+        )
+    ]
+    
+    return {
+        "household": household,
+        "my_chores": my_chores,
+        "household_chores": household_chores
+    }
@@ -1,22 +1,248 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, exists, func, literal, select, true, update
+from sqlalchemy.orm import Session, aliased
 from uuid import UUID
-from typing import List
+from typing import Iterator, List, Optional
+import csv
+import io
+import json
 
-from ..core.database import get_db
+from ..core.database import SessionLocal, get_db
 from ..core.auth import get_current_active_user
+from ..core.household_context import (
+    HouseholdContext,
+    get_household_context
+)
 from ..core.security import generate_invite_code
+from ..core.change_feed import mark_household_changed, next_change_seq
 from ..models.user import User
 from ..models.household import Household
+from ..models.chore import Chore
+from ..models.chore_assignment import ChoreAssignment
 from ..schemas.household import (
     HouseholdCreate,
     HouseholdResponse,
     HouseholdWithMembers,
-    HouseholdUpdate
+    HouseholdUpdate,
+    AdminTransfer
 )
 
 router = APIRouter(prefix="/households", tags=["households"])
 
+# Rows fetched per server-side cursor round-trip during exports
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    Chore.id.label("chore_id"),
+    Chore.title,
+    Chore.description,
+    Chore.due_date,
+    Chore.is_recurring,
+    Chore.recurrence_interval,
+    Chore.created_by_id,
+    Chore.created_at,
+    ChoreAssignment.id.label("assignment_id"),
+    ChoreAssignment.user_id,
+    ChoreAssignment.status,
+    ChoreAssignment.completed_at,
+]
+
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+def _stream_export_rows(household_id: UUID) -> Iterator[tuple]:
+    """Yield export rows from a server-side cursor on a dedicated session.
+
+    The session is opened when the stream starts and closed as soon as it
+    ends, so the pooled connection is only held while rows are being sent.
+    """
+    db = SessionLocal()
+    try:
+        statement = (
+            select(*EXPORT_COLUMNS)
+            .outerjoin(ChoreAssignment, ChoreAssignment.chore_id == Chore.id)
+            .where(Chore.household_id == household_id)
+            .order_by(Chore.due_date, Chore.id, ChoreAssignment.created_at)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for partition in db.execute(statement).partitions():
+            yield from partition
+    finally:
+        db.close()
+
+def _export_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+def _export_ndjson(household_id: UUID) -> Iterator[str]:
+    buffer = []
+    for row in _stream_export_rows(household_id):
+        record = {field: _export_value(value) for field, value in zip(EXPORT_FIELDS, row)}
+        buffer.append(json.dumps(record) + "\n")
+        if len(buffer) >= EXPORT_BATCH_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer)
+
+def _export_csv(household_id: UUID) -> Iterator[str]:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(EXPORT_FIELDS)
+    pending = 0
+    for row in _stream_export_rows(household_id):
+        writer.writerow(["" if value is None else _export_value(value) for value in row])
+        pending += 1
+        if pending >= EXPORT_BATCH_SIZE:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            pending = 0
+    yield output.getvalue()
+
+def _reassign_pending_assignments(db: Session, household_id: UUID, user_id: UUID, policy: str):
+    """Hand a departing member's pending assignments to the remaining members.
+
+    Runs a fixed number of set-based statements regardless of how many
+    assignments the member had. Returns (reassigned, released) counts.
+    """
+    is_departing_pending = (
+        ChoreAssignment.user_id == user_id,
+        ChoreAssignment.status == "pending",
+        ChoreAssignment.chore_id.in_(
+            select(Chore.id).where(Chore.household_id == household_id)
+        )
+    )
+    
+    # Every affected chore shows up in the change feed
+    db.execute(
+        update(Chore)
+        .where(Chore.id.in_(select(ChoreAssignment.chore_id).where(*is_departing_pending)))
+        .values(change_seq=next_change_seq(db, household_id))
+        .execution_options(synchronize_session=False)
+    )
+    
+    # Chores someone else still has pending stay covered; just drop the departing member
+    other_pending = select(ChoreAssignment.id).where(
+        ChoreAssignment.chore_id == Chore.id,
+        ChoreAssignment.user_id != user_id,
+        ChoreAssignment.status == "pending"
+    ).correlate(Chore)
+    shared_chores = select(Chore.id).where(
+        Chore.household_id == household_id,
+        other_pending.exists()
+    )
+    released = db.execute(
+        delete(ChoreAssignment)
+        .where(*is_departing_pending, ChoreAssignment.chore_id.in_(shared_chores))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    
+    if policy == "release":
+        return 0, released + db.execute(
+            delete(ChoreAssignment)
+            .where(*is_departing_pending)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    
+    # Number the remaining assignments, then give each member a run of slots
+    # starting after its current load and hand out the lowest slots in order.
+    # With every load at zero this is plain round-robin.
+    pending = select(
+        ChoreAssignment.id,
+        ChoreAssignment.chore_id,
+        func.row_number().over(order_by=(Chore.due_date, Chore.id)).label("position")
+    ).join(Chore, Chore.id == ChoreAssignment.chore_id).where(
+        ChoreAssignment.user_id == user_id,
+        ChoreAssignment.status == "pending",
+        Chore.household_id == household_id
+    ).cte("pending")
+    
+    if policy == "least_loaded":
+        load = select(func.count(ChoreAssignment.id)).join(
+            Chore, Chore.id == ChoreAssignment.chore_id
+        ).where(
+            ChoreAssignment.user_id == User.id,
+            ChoreAssignment.status == "pending",
+            Chore.household_id == household_id
+        ).correlate(User).scalar_subquery()
+    else:
+        load = literal(0)
+    
+    members = select(User.id.label("user_id"), load.label("load")).where(
+        User.household_id == household_id,
+        User.id != user_id
+    ).cte("members")
+    
+    slots = select(
+        members.c.user_id,
+        func.row_number().over(
+            order_by=(members.c.load + pending.c.position, members.c.user_id)
+        ).label("slot")
+    ).select_from(members.join(pending, true())).cte("slots")
+    
+    # A member who already has an assignment on the chore (e.g. completed)
+    # cannot take a second one
+    held = aliased(ChoreAssignment)
+    targets = select(pending.c.id, slots.c.user_id).join(
+        slots, slots.c.slot == pending.c.position
+    ).where(
+        ~exists().where(held.chore_id == pending.c.chore_id, held.user_id == slots.c.user_id)
+    ).subquery()
+    
+    reassigned = len(db.execute(
+        update(ChoreAssignment)
+        .where(ChoreAssignment.id == targets.c.id)
+        .values(user_id=targets.c.user_id)
+        .returning(ChoreAssignment.id)
+        .execution_options(synchronize_session=False)
+    ).all())
+    
+    # Assignments whose slot went to such a member go to the eligible member
+    # with the fewest pending chores instead
+    current_load = select(func.count(held.id)).join(
+        Chore, Chore.id == held.chore_id
+    ).where(
+        held.user_id == User.id,
+        held.status == "pending",
+        Chore.household_id == household_id
+    ).correlate(User).scalar_subquery()
+    candidates = select(
+        ChoreAssignment.id.label("assignment_id"),
+        User.id.label("user_id"),
+        func.row_number().over(
+            partition_by=ChoreAssignment.id,
+            order_by=(current_load, User.id)
+        ).label("choice")
+    ).join(
+        User, (User.household_id == household_id) & (User.id != user_id)
+    ).where(
+        *is_departing_pending,
+        ~exists().where(held.chore_id == ChoreAssignment.chore_id, held.user_id == User.id)
+    ).subquery()
+    
+    reassigned += len(db.execute(
+        update(ChoreAssignment)
+        .where(ChoreAssignment.id == candidates.c.assignment_id, candidates.c.choice == 1)
+        .values(user_id=candidates.c.user_id)
+        .returning(ChoreAssignment.id)
+        .execution_options(synchronize_session=False)
+    ).all())
+    
+    # Only left over when there are no other members to take them
+    released += db.execute(
+        delete(ChoreAssignment)
+        .where(*is_departing_pending)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    
+    return reassigned, released
+
 @router.post("/", response_model=HouseholdResponse)
 async def create_household(
     household: HouseholdCreate,
@@ -77,12 +303,44 @@ async def get_household(
     
     return household
 
+@router.get("/{household_id}/export")
+async def export_household(
+    household_id: UUID,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Stream the household's chores and completion history as NDJSON or CSV"""
+    if not current_user.household_id or current_user.household_id != household_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User does not belong to this household"
+        )
+    
+    # Release the request session's connection before streaming; the export
+    # runs on its own session for as long as the response body takes.
+    db.close()
+    
+    if export_format == "csv":
+        content, media_type = _export_csv(household_id), "text/csv"
+    else:
+        content, media_type = _export_ndjson(household_id), "application/x-ndjson"
+    
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="household-{household_id}.{export_format}"'
+        }
+    )
+
 @router.put("/{household_id}", response_model=HouseholdResponse)
 async def update_household(
     household_id: UUID,
     household_update: HouseholdUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
 ):
     """Update household details"""
     if not current_user.household_id or current_user.household_id != household_id:
@@ -91,32 +349,41 @@ async def update_household(
             detail="User does not belong to this household"
         )
     
-    household = db.query(Household).filter(Household.id == household_id).first()
     if not household:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Household not found"
         )
     
-    if household.admin_id != current_user.id:
+    if not household.is_admin(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only household admin can update household"
         )
     
-    if household_update.name is not None:
-        household.name = household_update.name
+    values = household_update.dict(exclude_unset=True, exclude_none=True)
+    if "name" in values:
+        # Calendar feeds carry the name; a new sequence changes their ETags
+        values["change_seq"] = next_change_seq(db, household_id)
+    if values:
+        db_household = db.scalars(
+            update(Household)
+            .where(Household.id == household_id)
+            .values(**values)
+            .returning(Household)
+        ).one()
+        db.commit()
+    else:
+        db_household = db.query(Household).filter(Household.id == household_id).first()
     
-    db.commit()
-    db.refresh(household)
-    
-    return household
+    return db_household
 
 @router.post("/{household_id}/invites", response_model=dict)
 async def generate_invite(
     household_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
 ):
     """Generate a new invite code"""
     if not current_user.household_id or current_user.household_id != household_id:
@@ -125,14 +392,13 @@ async def generate_invite(
             detail="User does not belong to this household"
         )
     
-    household = db.query(Household).filter(Household.id == household_id).first()
     if not household:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Household not found"
         )
     
-    if household.admin_id != current_user.id:
+    if not household.is_admin(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only household admin can generate invites"
@@ -143,7 +409,11 @@ async def generate_invite(
     while db.query(Household).filter(Household.invite_code == invite_code).first():
         invite_code = generate_invite_code()
     
-    household.invite_code = invite_code
+    db.execute(
+        update(Household)
+        .where(Household.id == household_id)
+        .values(invite_code=invite_code)
+    )
     db.commit()
     
     return {
@@ -151,6 +421,115 @@ async def generate_invite(
         "invite_url": f"http://localhost:3000/join?code={invite_code}"
     }
 
+@router.delete("/{household_id}/members/{user_id}", response_model=dict)
+async def remove_member(
+    household_id: UUID,
+    user_id: UUID,
+    reassign: str = Query("round_robin", pattern="^(round_robin|least_loaded|release)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
+):
+    """Remove a member and redistribute or release their pending chores"""
+    if not current_user.household_id or current_user.household_id != household_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User does not belong to this household"
+        )
+    
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Household not found"
+        )
+    
+    if not household.is_admin(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only household admin can remove members"
+        )
+    
+    if household.is_admin(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Transfer the admin role before removing the admin"
+        )
+    
+    if not household.is_member(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member not found"
+        )
+    
+    reassigned, released = _reassign_pending_assignments(db, household_id, user_id, reassign)
+    
+    db.execute(
+        update(User)
+        .where(User.id == user_id, User.household_id == household_id)
+        .values(household_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    mark_household_changed(db, household_id)
+    db.commit()
+    
+    return {
+        "message": "Member removed successfully",
+        "reassigned": reassigned,
+        "released": released
+    }
+
+@router.post("/{household_id}/admin", response_model=HouseholdResponse)
+async def transfer_admin(
+    household_id: UUID,
+    transfer: AdminTransfer,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    household: Optional[HouseholdContext] = Depends(get_household_context)
+):
+    """Transfer the admin role to another member"""
+    if not current_user.household_id or current_user.household_id != household_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User does not belong to this household"
+        )
+    
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Household not found"
+        )
+    
+    if not household.is_admin(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only household admin can transfer the admin role"
+        )
+    
+    if not household.is_member(transfer.user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member not found"
+        )
+    
+    # Guard on the current admin so concurrent transfers cannot both win
+    db_household = db.scalars(
+        update(Household)
+        .where(Household.id == household_id, Household.admin_id == current_user.id)
+        .values(admin_id=transfer.user_id)
+        .returning(Household)
+    ).first()
+    
+    if not db_household:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Household admin changed, please retry"
+        )
+    
+    db.commit()
+    
+    return db_household
+
 @router.post("/join", response_model=HouseholdResponse)
 async def join_household(
     invite_code: str,
@@ -172,6 +551,7 @@ async def join_household(
         )
     
     current_user.household_id = household.id
+    mark_household_changed(db, household.id)
     db.commit()
     
     return household
\ No newline at end of file
@@ -1,11 +1,13 @@
 from .user import UserBase, UserCreate, UserResponse, UserUpdate
-from .household import HouseholdBase, HouseholdCreate, HouseholdResponse, HouseholdWithMembers, HouseholdUpdate
-from .chore import ChoreBase, ChoreCreate, ChoreResponse, ChoreWithAssignments, ChoreUpdate
+from .household import HouseholdBase, HouseholdCreate, HouseholdResponse, HouseholdWithMembers, HouseholdUpdate, AdminTransfer
+from .chore import ChoreBase, ChoreCreate, ChoreResponse, ChoreWithAssignments, ChoreSummary, ChoreFields, ChoreChanges, ChoreUpdate
 from .chore_assignment import ChoreAssignmentBase, ChoreAssignmentCreate, ChoreAssignmentResponse, ChoreAssignmentUpdate, MarkComplete
+from .dashboard import DashboardResponse
 
 __all__ = [
     "UserBase", "UserCreate", "UserResponse", "UserUpdate",
-    "HouseholdBase", "HouseholdCreate", "HouseholdResponse", "HouseholdWithMembers", "HouseholdUpdate",
-    "ChoreBase", "ChoreCreate", "ChoreResponse", "ChoreWithAssignments", "ChoreUpdate",
-    "ChoreAssignmentBase", "ChoreAssignmentCreate", "ChoreAssignmentResponse", "ChoreAssignmentUpdate", "MarkComplete"
+    "HouseholdBase", "HouseholdCreate", "HouseholdResponse", "HouseholdWithMembers", "HouseholdUpdate", "AdminTransfer",
+    "ChoreBase", "ChoreCreate", "ChoreResponse", "ChoreWithAssignments", "ChoreSummary", "ChoreFields", "ChoreChanges", "ChoreUpdate",
+    "ChoreAssignmentBase", "ChoreAssignmentCreate", "ChoreAssignmentResponse", "ChoreAssignmentUpdate", "MarkComplete",
+    "DashboardResponse"
 ]
\ No newline at end of file
@@ -25,6 +25,32 @@ class ChoreResponse(ChoreBase):
 class ChoreWithAssignments(ChoreResponse):
     assignments: List["ChoreAssignmentResponse"] = []
 
+class ChoreSummary(BaseModel):
+    """Compact chore row for widgets and mobile list views"""
+    id: UUID
+    title: str
+    due_date: date
+    is_pending: bool
+
+class ChoreFields(BaseModel):
+    """Sparse chore row; only the requested fields are serialized"""
+    id: UUID
+    title: Optional[str] = None
+    description: Optional[str] = None
+    due_date: Optional[date] = None
+    is_recurring: Optional[bool] = None
+    recurrence_interval: Optional[str] = None
+    created_by_id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+    is_pending: Optional[bool] = None
+
+class ChoreChanges(BaseModel):
+    """Chores changed since a sync token, with their current assignments"""
+    chores: List["ChoreWithAssignments"] = []
+    deleted_chore_ids: List[UUID] = []
+    next_token: str
+    reset: bool = False
+
 class ChoreUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
@@ -34,4 +60,5 @@ class ChoreUpdate(BaseModel):
 
 # Import here to avoid circular imports
 from .chore_assignment import ChoreAssignmentResponse
-ChoreWithAssignments.model_rebuild()
\ No newline at end of file
+ChoreWithAssignments.model_rebuild()
+ChoreChanges.model_rebuild()
\ No newline at end of file
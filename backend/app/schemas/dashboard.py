@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+from .household import HouseholdWithMembers
+from .chore import ChoreWithAssignments
+
+class DashboardResponse(BaseModel):
+    household: Optional[HouseholdWithMembers] = None
+    my_chores: List[ChoreWithAssignments] = []
+    household_chores: List[ChoreWithAssignments] = []
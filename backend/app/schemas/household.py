@@ -24,6 +24,9 @@ class HouseholdWithMembers(HouseholdResponse):
 class HouseholdUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
 
+class AdminTransfer(BaseModel):
+    user_id: UUID
+
 # Import here to avoid circular imports
 from .user import UserResponse
 HouseholdWithMembers.model_rebuild()
\ No newline at end of file
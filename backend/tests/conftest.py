@@ -0,0 +1,91 @@
+import os
+import tempfile
+from unittest import mock
+
+import pytest
+
+# Configure the app before it is imported: a throwaway SQLite database unless
+# TEST_DATABASE_URL points at PostgreSQL, and dummy Firebase credentials.
+_tmpdir = tempfile.mkdtemp(prefix="chorrus-tests-")
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", f"sqlite:///{_tmpdir}/test.db")
+os.environ["PROFILE_DIR"] = os.path.join(_tmpdir, "profiles")
+os.environ["RATE_LIMIT_USER_BURST"] = "100000"
+os.environ["RATE_LIMIT_HOUSEHOLD_BURST"] = "100000"
+for name in (
+    "FIREBASE_PROJECT_ID",
+    "FIREBASE_PRIVATE_KEY_ID",
+    "FIREBASE_PRIVATE_KEY",
+    "FIREBASE_CLIENT_EMAIL",
+    "FIREBASE_CLIENT_ID",
+):
+    os.environ.setdefault(name, "test")
+
+with mock.patch("firebase_admin.credentials.Certificate"), mock.patch("firebase_admin.initialize_app"):
+    from app.main import app
+
+from fastapi.testclient import TestClient
+from firebase_admin import auth as firebase_auth
+from sqlalchemy import event
+
+from app.core.database import Base, SessionLocal, engine
+
+def fake_verify_id_token(token):
+    """Test tokens look like `test:<uid>`, or `test:<uid>:<nonce>` for a refreshed token"""
+    if not token.startswith("test:"):
+        raise ValueError("invalid token")
+    uid = token.split(":")[1]
+    return {"uid": uid, "email": f"{uid}@example.com", "name": uid}
+
+def auth(uid: str) -> dict:
+    return {"Authorization": f"Bearer test:{uid}"}
+
+@pytest.fixture(autouse=True)
+def database(monkeypatch):
+    monkeypatch.setattr(firebase_auth, "verify_id_token", fake_verify_id_token)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+@pytest.fixture
+def query_counter():
+    """Count SQL statements sent to the database while the fixture is active"""
+    counter = {"count": 0}
+    
+    def count(*args):
+        counter["count"] += 1
+    
+    event.listen(engine, "before_cursor_execute", count)
+    yield counter
+    event.remove(engine, "before_cursor_execute", count)
+
+def create_household(client, admin: str, members=(), name: str = "Home") -> dict:
+    """Create a household owned by `admin` and join `members` to it.
+
+    Returns the household response with a `member_ids` map of uid -> user id.
+    """
+    household = client.post("/api/v1/households/", json={"name": name}, headers=auth(admin)).json()
+    for uid in members:
+        client.post(
+            "/api/v1/households/join",
+            params={"invite_code": household["invite_code"]},
+            headers=auth(uid)
+        )
+    members = client.get(f"/api/v1/households/{household['id']}", headers=auth(admin)).json()["members"]
+    household["member_ids"] = {member["email"].split("@")[0]: member["id"] for member in members}
+    return household
+
+def create_chore(client, uid: str, **fields) -> dict:
+    payload = {"title": "Chore", "due_date": "2026-01-01"}
+    payload.update(fields)
+    return client.post("/api/v1/chores/", json=payload, headers=auth(uid)).json()
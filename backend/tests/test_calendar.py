@@ -0,0 +1,128 @@
+import time
+from urllib.parse import urlparse
+
+from app.core import calendar_feed
+from app.core.config import settings
+from app.models.user import User
+from tests.conftest import auth, create_chore, create_household
+
+def _feed_paths(client, uid: str) -> dict:
+    links = client.get("/api/v1/calendar/links", headers=auth(uid)).json()
+    return {kind: urlparse(url).path for kind, url in links.items()}
+
+def test_feeds_render_and_revalidate(client):
+    household = create_household(client, "alice", members=["bob"])
+    create_chore(
+        client, "alice",
+        title="Bins; recycling",
+        is_recurring=True,
+        recurrence_interval="weekly",
+        assigned_user_ids=[household["member_ids"]["bob"]]
+    )
+    create_chore(client, "alice", title="Windows")
+    paths = _feed_paths(client, "bob")
+    
+    response = client.get(paths["household"])
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.text.count("BEGIN:VEVENT") == 2
+    assert "SUMMARY:Bins\\; recycling" in response.text
+    assert "RRULE:FREQ=WEEKLY" in response.text
+    
+    mine = client.get(paths["mine"])
+    assert mine.text.count("BEGIN:VEVENT") == 1
+    
+    etag = response.headers["ETag"]
+    assert client.get(paths["household"], headers={"If-None-Match": etag}).status_code == 304
+    
+    create_chore(client, "alice", title="Mop")
+    response = client.get(paths["household"], headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.text.count("BEGIN:VEVENT") == 3
+
+def test_feed_tokens_are_bound_to_kind(client):
+    create_household(client, "alice")
+    paths = _feed_paths(client, "alice")
+    
+    token = paths["mine"].rsplit("/", 1)[1]
+    assert client.get(f"/api/v1/calendar/household/{token}").status_code == 404
+    assert client.get(f"/api/v1/calendar/other/{token}").status_code == 404
+
+def test_removed_member_loses_feed_while_others_keep_it_warm(client):
+    household = create_household(client, "alice", members=["bob"])
+    create_chore(client, "alice", title="Dishes")
+    alice_paths = _feed_paths(client, "alice")
+    bob_paths = _feed_paths(client, "bob")
+    
+    assert client.get(alice_paths["household"]).status_code == 200
+    assert client.get(bob_paths["household"]).status_code == 200
+    
+    response = client.delete(
+        f"/api/v1/households/{household['id']}/members/{household['member_ids']['bob']}",
+        headers=auth("alice")
+    )
+    assert response.status_code == 200
+    
+    for _ in range(2):
+        assert client.get(alice_paths["household"]).status_code == 200
+        assert client.get(bob_paths["household"]).status_code == 404
+        assert client.get(bob_paths["mine"]).status_code == 404
+
+def test_feed_cache_is_not_shared_between_members(client, db):
+    create_household(client, "alice", members=["bob"])
+    bob_paths = _feed_paths(client, "bob")
+    alice_paths = _feed_paths(client, "alice")
+    
+    # Remove bob's membership behind this process's back, as another replica would
+    db.query(User).filter(User.firebase_uid == "bob").update({User.household_id: None})
+    db.commit()
+    
+    assert client.get(alice_paths["household"]).status_code == 200
+    assert client.get(bob_paths["household"]).status_code == 404
+
+class _Clock:
+    def __init__(self):
+        self.now = time.monotonic()
+
+    def monotonic(self):
+        return self.now
+
+def test_conditional_polls_rewarm_expired_cache(client, monkeypatch, query_counter):
+    create_household(client, "alice")
+    create_chore(client, "alice")
+    path = _feed_paths(client, "alice")["household"]
+    clock = _Clock()
+    monkeypatch.setattr(calendar_feed, "time", clock)
+    
+    etag = client.get(path).headers["ETag"]
+    clock.now += settings.CALENDAR_CACHE_TTL_SECONDS + 1
+    
+    def poll():
+        start = query_counter["count"]
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        return query_counter["count"] - start
+    
+    # The first poll after expiry checks the database, later ones do not
+    assert poll() == 1
+    assert [poll() for _ in range(5)] == [0] * 5
+    
+    # A validator-only entry cannot serve a full body; that poll renders again
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.text.count("BEGIN:VEVENT") == 1
+
+def test_rename_changes_feed_name_and_etag(client):
+    household = create_household(client, "alice", name="Flat")
+    path = _feed_paths(client, "alice")["household"]
+    first = client.get(path)
+    assert "X-WR-CALNAME:Flat" in first.text
+    
+    response = client.put(f"/api/v1/households/{household['id']}", json={"name": "House"}, headers=auth("alice"))
+    assert response.status_code == 200
+    
+    response = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert "X-WR-CALNAME:House" in response.text
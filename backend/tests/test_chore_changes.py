@@ -0,0 +1,99 @@
+from tests.conftest import auth, create_chore, create_household
+
+def _changes(client, uid="alice", since=None):
+    params = {"since": since} if since else {}
+    response = client.get("/api/v1/chores/changes", params=params, headers=auth(uid))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def _changed_ids(delta):
+    return [chore["id"] for chore in delta["chores"]]
+
+def test_snapshot_without_token(client):
+    create_household(client, "alice")
+    chore = create_chore(client, "alice")
+    
+    delta = _changes(client)
+    assert delta["reset"] is True
+    assert _changed_ids(delta) == [chore["id"]]
+    assert delta["deleted_chore_ids"] == []
+
+def test_token_from_another_household_resets(client):
+    create_household(client, "alice")
+    create_household(client, "bob")
+    create_chore(client, "bob")
+    bob_token = _changes(client, "bob")["next_token"]
+    chore = create_chore(client, "alice")
+    
+    delta = _changes(client, "alice", since=bob_token)
+    assert delta["reset"] is True
+    assert _changed_ids(delta) == [chore["id"]]
+
+def test_malformed_token_is_rejected(client):
+    create_household(client, "alice")
+    for token in ("garbage", "nothex.1", "0" * 32 + ".x"):
+        response = client.get("/api/v1/chores/changes", params={"since": token}, headers=auth("alice"))
+        assert response.status_code == 400
+
+def test_unchanged_household_returns_empty_delta(client):
+    create_household(client, "alice")
+    create_chore(client, "alice")
+    token = _changes(client)["next_token"]
+    
+    delta = _changes(client, since=token)
+    assert delta == {"chores": [], "deleted_chore_ids": [], "next_token": token, "reset": False}
+
+def test_created_and_updated_chores_appear_once(client):
+    create_household(client, "alice")
+    untouched = create_chore(client, "alice", title="Untouched")
+    token = _changes(client)["next_token"]
+    
+    created = create_chore(client, "alice", title="New")
+    response = client.put(f"/api/v1/chores/{created['id']}", json={"title": "Renamed"}, headers=auth("alice"))
+    assert response.status_code == 200
+    
+    delta = _changes(client, since=token)
+    assert delta["reset"] is False
+    assert _changed_ids(delta) == [created["id"]]
+    assert delta["chores"][0]["title"] == "Renamed"
+    assert untouched["id"] not in _changed_ids(delta)
+    assert _changes(client, since=delta["next_token"])["chores"] == []
+
+def test_completion_surfaces_chore(client):
+    household = create_household(client, "alice")
+    chore = create_chore(client, "alice", assigned_user_ids=[household["member_ids"]["alice"]])
+    token = _changes(client)["next_token"]
+    
+    assert client.post(f"/api/v1/chores/{chore['id']}/complete", headers=auth("alice")).status_code == 200
+    
+    delta = _changes(client, since=token)
+    assert _changed_ids(delta) == [chore["id"]]
+    assert delta["chores"][0]["assignments"][0]["status"] == "completed"
+
+def test_delete_produces_tombstone(client):
+    create_household(client, "alice")
+    chore = create_chore(client, "alice")
+    token = _changes(client)["next_token"]
+    
+    assert client.delete(f"/api/v1/chores/{chore['id']}", headers=auth("alice")).status_code == 200
+    
+    delta = _changes(client, since=token)
+    assert delta["chores"] == []
+    assert delta["deleted_chore_ids"] == [chore["id"]]
+    # A fresh snapshot no longer includes it
+    assert _changes(client)["chores"] == []
+
+def test_member_removal_bumps_reassigned_chores(client):
+    household = create_household(client, "alice", members=["bob"])
+    alice_id = household["member_ids"]["alice"]
+    bob_id = household["member_ids"]["bob"]
+    bobs = create_chore(client, "alice", title="Bob's", assigned_user_ids=[bob_id])
+    create_chore(client, "alice", title="Alice's", assigned_user_ids=[alice_id])
+    token = _changes(client)["next_token"]
+    
+    response = client.delete(f"/api/v1/households/{household['id']}/members/{bob_id}", headers=auth("alice"))
+    assert response.status_code == 200
+    
+    delta = _changes(client, since=token)
+    assert _changed_ids(delta) == [bobs["id"]]
+    assert [a["user_id"] for a in delta["chores"][0]["assignments"]] == [alice_id]
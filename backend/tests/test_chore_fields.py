@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from tests.conftest import auth, create_chore, create_household
+
+SUMMARY_KEYS = {"id", "title", "due_date", "is_pending"}
+
+@pytest.fixture
+def household(client):
+    household = create_household(client, "alice", members=["bob"])
+    alice_id = household["member_ids"]["alice"]
+    bob_id = household["member_ids"]["bob"]
+    
+    shared = create_chore(client, "alice", title="Shared", due_date="2026-01-01", assigned_user_ids=[alice_id, bob_id])
+    create_chore(client, "alice", title="Mine", due_date="2026-01-02", assigned_user_ids=[alice_id])
+    create_chore(client, "alice", title="Unassigned", due_date="2026-01-03")
+    
+    # Alice is done with the shared chore; bob still has it pending
+    assert client.post(f"/api/v1/chores/{shared['id']}/complete", headers=auth("alice")).status_code == 200
+    return household
+
+@pytest.fixture
+def captured_statements():
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+def _assignment_loads(statements):
+    return [statement for statement in statements if statement.lstrip().startswith("SELECT chore_assignments.")]
+
+def _get(client, path, **params):
+    response = client.get(path, params=params, headers=auth("alice"))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+@pytest.mark.parametrize("path", ["/api/v1/chores/", "/api/v1/chores/my-chores"])
+def test_summary_view_keys(client, household, path):
+    chores = _get(client, path, view="summary", include_completed=True)
+    assert chores
+    assert all(set(chore) == SUMMARY_KEYS for chore in chores)
+
+@pytest.mark.parametrize("path", ["/api/v1/chores/", "/api/v1/chores/my-chores"])
+def test_fields_keys(client, household, path):
+    chores = _get(client, path, fields="title, due_date,title", include_completed=True)
+    assert chores
+    assert all(set(chore) == {"id", "title", "due_date"} for chore in chores)
+    
+    chores = _get(client, path, fields="created_by_id,is_pending", view="summary", include_completed=True)
+    assert all(set(chore) == {"id", "created_by_id", "is_pending"} for chore in chores)
+
+@pytest.mark.parametrize("path", ["/api/v1/chores/", "/api/v1/chores/my-chores"])
+def test_unknown_fields_rejected(client, household, path):
+    response = client.get(path, params={"fields": "title,password"}, headers=auth("alice"))
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+def test_is_pending_semantics(client, household):
+    # Household list: pending while any member's assignment is pending
+    household_view = {chore["title"]: chore["is_pending"] for chore in _get(client, "/api/v1/chores/", view="summary")}
+    assert household_view == {"Shared": True, "Mine": True, "Unassigned": False}
+    
+    # My chores: pending only while the caller's own assignment is pending
+    my_view = {
+        chore["title"]: chore["is_pending"]
+        for chore in _get(client, "/api/v1/chores/my-chores", view="summary", include_completed=True)
+    }
+    assert my_view == {"Shared": False, "Mine": True}
+    
+    pending = _get(client, "/api/v1/chores/my-chores", view="summary")
+    assert [chore["title"] for chore in pending] == ["Mine"]
+
+@pytest.mark.parametrize("path", ["/api/v1/chores/", "/api/v1/chores/my-chores"])
+def test_sparse_views_skip_assignment_loading(client, household, captured_statements, path):
+    _get(client, path, view="summary", include_completed=True)
+    summary = list(captured_statements)
+    captured_statements.clear()
+    _get(client, path, include_completed=True)
+    full = list(captured_statements)
+    
+    # The full view loads assignments with separate SELECTs; the sparse views never do
+    assert _assignment_loads(full)
+    assert not _assignment_loads(summary)
+    assert len(summary) < len(full)
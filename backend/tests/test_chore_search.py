@@ -0,0 +1,128 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event, inspect
+
+from app.core.database import engine
+from tests.conftest import auth, create_chore, create_household
+
+IS_POSTGRESQL = engine.dialect.name == "postgresql"
+
+@pytest.fixture
+def household(client):
+    household = create_household(client, "alice", members=["bob"])
+    bob_id = household["member_ids"]["bob"]
+    start = date(2026, 3, 1)
+    for i in range(30):
+        create_chore(
+            client, "alice",
+            title=f"Vacuum room {i}" if i % 3 == 0 else f"Dishes {i}",
+            description="Under the 100% sofa" if i == 3 else None,
+            due_date=(start + timedelta(days=i)).isoformat(),
+            is_recurring=i % 2 == 0,
+            recurrence_interval="weekly" if i % 2 == 0 else None,
+            assigned_user_ids=[bob_id] if i % 5 == 0 else []
+        )
+    return household
+
+@pytest.fixture
+def captured_statements():
+    """Collect (statement, parameters) for every SELECT on chores"""
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM chores" in statement:
+            statements.append((statement, parameters))
+    
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+def _list(client, **params):
+    response = client.get("/api/v1/chores/", params=params, headers=auth("alice"))
+    assert response.status_code == 200, response.text
+    return response
+
+def _plan(statement, parameters) -> str:
+    prefix = "EXPLAIN " if IS_POSTGRESQL else "EXPLAIN QUERY PLAN "
+    with engine.connect() as conn:
+        if IS_POSTGRESQL:
+            conn.exec_driver_sql("SET enable_seqscan = off")
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+    return "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+def test_filters(client, household):
+    titles = [chore["title"] for chore in _list(client, q="vacuum").json()]
+    assert titles == [f"Vacuum room {i}" for i in range(0, 30, 3)]
+    
+    # LIKE wildcards in the query are matched literally
+    assert [chore["title"] for chore in _list(client, q="100%").json()] == ["Vacuum room 3"]
+    
+    chores = _list(client, due_from="2026-03-05", due_to="2026-03-07").json()
+    assert [chore["due_date"] for chore in chores] == ["2026-03-05", "2026-03-06", "2026-03-07"]
+    
+    chores = _list(client, assignee_id=household["member_ids"]["bob"], status="pending").json()
+    assert len(chores) == 6
+    
+    chores = _list(client, is_recurring=True, recurrence_interval="weekly").json()
+    assert len(chores) == 15
+
+def test_keyset_paging_visits_every_chore_once(client, household):
+    seen = []
+    after = None
+    while True:
+        params = {"limit": 7, "view": "summary"}
+        if after:
+            params["after"] = after
+        response = _list(client, **params)
+        seen.extend(chore["id"] for chore in response.json())
+        after = response.headers.get("X-Next-Cursor")
+        if not after:
+            break
+    
+    assert len(seen) == len(set(seen)) == 30
+    
+    response = client.get("/api/v1/chores/", params={"after": "garbage"}, headers=auth("alice"))
+    assert response.status_code == 400
+
+def test_paged_list_uses_household_due_date_index(client, household, captured_statements):
+    first = _list(client, limit=10)
+    _list(client, limit=10, after=first.headers["X-Next-Cursor"])
+    
+    pages = [s for s in captured_statements if "ORDER BY chores.due_date" in s[0]]
+    assert len(pages) == 2
+    for statement, parameters in pages:
+        plan = _plan(statement, parameters)
+        assert "ix_chores_household_id_due_date_id" in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
+
+def test_assignee_filter_uses_assignment_index(client, household, captured_statements):
+    _list(client, assignee_id=household["member_ids"]["bob"], status="pending")
+    
+    statement, parameters = next(s for s in captured_statements if "chore_assignments" in s[0])
+    plan = _plan(statement, parameters)
+    assert "ix_chore_assignments_" in plan, plan
+
+def test_trigram_indexes_only_on_postgresql():
+    index_names = {index["name"] for index in inspect(engine).get_indexes("chores")}
+    assert ("ix_chores_title_trgm" in index_names) == IS_POSTGRESQL
+    assert ("ix_chores_description_trgm" in index_names) == IS_POSTGRESQL
+
+@pytest.mark.skipif(not IS_POSTGRESQL, reason="trigram search indexes are PostgreSQL-only")
+def test_text_search_uses_trigram_index(client, household, captured_statements):
+    _list(client, q="vacuum")
+    
+    statement, parameters = next(s for s in captured_statements if "ILIKE" in s[0].upper())
+    plan = _plan(statement, parameters)
+    assert "ix_chores_title_trgm" in plan, plan
+
+def test_next_cursor_is_exposed_to_browsers(client, household):
+    origin = "http://localhost:3000"
+    response = client.get(
+        "/api/v1/chores/",
+        params={"limit": 5},
+        headers={**auth("alice"), "Origin": origin}
+    )
+    assert response.headers["access-control-allow-origin"] == origin
+    exposed = [h.strip().lower() for h in response.headers["access-control-expose-headers"].split(",")]
+    assert "x-next-cursor" in exposed
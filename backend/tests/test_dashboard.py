@@ -0,0 +1,53 @@
+from tests.conftest import auth, create_chore, create_household
+
+THREE_CALL_SEQUENCE = (
+    "/api/v1/households/{household_id}",
+    "/api/v1/chores/my-chores",
+    "/api/v1/chores/",
+)
+
+def _seed(client, chore_count: int) -> dict:
+    household = create_household(client, "alice", members=["bob", "carol"])
+    member_ids = list(household["member_ids"].values())
+    for i in range(chore_count):
+        create_chore(
+            client, "alice",
+            title=f"Chore {i}",
+            due_date=f"2026-01-{i % 28 + 1:02d}",
+            assigned_user_ids=member_ids[: i % 3 + 1]
+        )
+    return household
+
+def _count_queries(client, query_counter, path: str) -> int:
+    start = query_counter["count"]
+    response = client.get(path, headers=auth("alice"))
+    assert response.status_code == 200
+    return query_counter["count"] - start
+
+def test_dashboard_query_count_is_constant(client, query_counter):
+    _seed(client, 10)
+    small = _count_queries(client, query_counter, "/api/v1/dashboard")
+    
+    for i in range(30):
+        create_chore(client, "alice", title=f"Extra {i}")
+    large = _count_queries(client, query_counter, "/api/v1/dashboard")
+    
+    # user, household + members, chores + assignments
+    assert small == large == 5
+
+def test_dashboard_replaces_three_calls(client, query_counter):
+    household = _seed(client, 10)
+    
+    dashboard = _count_queries(client, query_counter, "/api/v1/dashboard")
+    sequence = sum(
+        _count_queries(client, query_counter, path.format(household_id=household["id"]))
+        for path in THREE_CALL_SEQUENCE
+    )
+    assert dashboard < sequence
+    
+    body = client.get("/api/v1/dashboard", headers=auth("alice")).json()
+    assert body["household"]["id"] == household["id"]
+    assert len(body["household"]["members"]) == 3
+    assert len(body["household_chores"]) == 10
+    my_chores = client.get("/api/v1/chores/my-chores", headers=auth("alice")).json()
+    assert {chore["id"] for chore in body["my_chores"]} == {chore["id"] for chore in my_chores}
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+import os
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+
+from app.routers.households import _export_ndjson
+from tests.conftest import auth, create_chore, create_household
+
+EXPORT_ROWS = int(os.getenv("EXPORT_TEST_ROWS", "1000000"))
+
+# Allowed RSS growth while streaming the large export
+RSS_CEILING_BYTES = 64 * 1024 * 1024
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+def _seed_chores(db, household_id: UUID, user_id: UUID, count: int) -> None:
+    """Insert `count` chores, each with one completed assignment, inside the database"""
+    params = {"household_id": household_id.hex, "user_id": user_id.hex, "count": count}
+    if db.bind.dialect.name == "postgresql":
+        params = {"household_id": str(household_id), "user_id": str(user_id), "count": count}
+        db.execute(text("""
+            INSERT INTO chores (id, household_id, created_by_id, title, due_date, is_recurring, change_seq)
+            SELECT md5(n::text)::uuid, :household_id, :user_id, 'Chore ' || n, DATE '2026-01-01', false, 0
+            FROM generate_series(1, :count) AS n
+        """), params)
+        db.execute(text("""
+            INSERT INTO chore_assignments (id, chore_id, user_id, status, completed_at)
+            SELECT md5('a' || n::text)::uuid, md5(n::text)::uuid, :user_id, 'completed', now()
+            FROM generate_series(1, :count) AS n
+        """), params)
+    else:
+        db.execute(text("""
+            WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :count)
+            INSERT INTO chores (id, household_id, created_by_id, title, due_date, is_recurring, change_seq)
+            SELECT printf('%032x', n), :household_id, :user_id, 'Chore ' || n, '2026-01-01', 0, 0 FROM seq
+        """), params)
+        db.execute(text("""
+            WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :count)
+            INSERT INTO chore_assignments (id, chore_id, user_id, status, completed_at)
+            SELECT printf('a%031x', n), printf('%032x', n), :user_id, 'completed', '2026-01-02 10:00:00'
+            FROM seq
+        """), params)
+    db.commit()
+
+def test_export_csv_and_ndjson(client):
+    household = create_household(client, "alice", members=["bob"])
+    bob_id = household["member_ids"]["bob"]
+    chore = create_chore(client, "alice", title="Dishes, then trash", assigned_user_ids=[bob_id])
+    create_chore(client, "alice", title="Unassigned")
+    
+    response = client.get(f"/api/v1/households/{household['id']}/export?format=csv", headers=auth("alice"))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assigned = next(row for row in rows if row["chore_id"] == chore["id"])
+    assert assigned["title"] == "Dishes, then trash"
+    assert assigned["user_id"] == bob_id
+    assert assigned["status"] == "pending"
+    
+    response = client.get(f"/api/v1/households/{household['id']}/export", headers=auth("alice"))
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert {record["title"] for record in records} == {"Dishes, then trash", "Unassigned"}
+    unassigned = next(record for record in records if record["title"] == "Unassigned")
+    assert unassigned["assignment_id"] is None
+
+def test_export_requires_membership(client):
+    household = create_household(client, "alice")
+    create_household(client, "mallory")
+    
+    response = client.get(f"/api/v1/households/{household['id']}/export", headers=auth("mallory"))
+    assert response.status_code == 403
+    
+    response = client.get(f"/api/v1/households/{household['id']}/export?format=xml", headers=auth("alice"))
+    assert response.status_code == 422
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="RSS sampling needs /proc")
+def test_large_export_streams_in_constant_memory(client, db):
+    household = create_household(client, "alice")
+    household_id = UUID(household["id"])
+    _seed_chores(db, household_id, UUID(household["member_ids"]["alice"]), EXPORT_ROWS)
+    
+    baseline = _rss_bytes()
+    peak = baseline
+    lines = 0
+    chunks = 0
+    largest_chunk = 0
+    for chunk in _export_ndjson(household_id):
+        chunks += 1
+        lines += chunk.count("\n")
+        largest_chunk = max(largest_chunk, len(chunk))
+        if chunks % 50 == 0:
+            peak = max(peak, _rss_bytes())
+    peak = max(peak, _rss_bytes())
+    
+    assert lines == EXPORT_ROWS
+    # Rows arrive in bounded batches rather than as one materialized body
+    assert chunks >= EXPORT_ROWS // 1000
+    assert largest_chunk < 1024 * 1024
+    assert peak - baseline < RSS_CEILING_BYTES
@@ -0,0 +1,59 @@
+from uuid import UUID
+
+from sqlalchemy import update
+
+from app.core.household_context import load_household_context
+from app.models.chore_assignment import ChoreAssignment
+from app.models.household import Household
+from tests.conftest import auth, create_chore, create_household
+
+def test_context_sees_changes_from_other_replicas(client, db, query_counter):
+    household = create_household(client, "alice", members=["bob"])
+    household_id = UUID(household["id"])
+    alice_id = UUID(household["member_ids"]["alice"])
+    bob_id = UUID(household["member_ids"]["bob"])
+    
+    start = query_counter["count"]
+    context = load_household_context(db, household_id)
+    assert query_counter["count"] - start == 1
+    assert context.is_admin(alice_id)
+    assert context.member_ids == {alice_id, bob_id}
+    
+    # Another replica transfers the admin role
+    db.execute(update(Household).where(Household.id == household_id).values(admin_id=bob_id))
+    db.commit()
+    
+    context = load_household_context(db, household_id)
+    assert context.is_admin(bob_id)
+    assert not context.is_admin(alice_id)
+
+def test_demoted_admin_and_removed_member_lose_access(client, db):
+    household = create_household(client, "alice", members=["bob", "carol"])
+    bob_id = household["member_ids"]["bob"]
+    carol_id = household["member_ids"]["carol"]
+    
+    # Warm the cache with alice as admin and carol as a member
+    create_chore(client, "alice", assigned_user_ids=[carol_id])
+    
+    response = client.post(
+        f"/api/v1/households/{household['id']}/admin",
+        json={"user_id": bob_id},
+        headers=auth("alice")
+    )
+    assert response.status_code == 200
+    
+    response = client.delete(f"/api/v1/households/{household['id']}/members/{carol_id}", headers=auth("alice"))
+    assert response.status_code == 403
+    
+    response = client.delete(f"/api/v1/households/{household['id']}/members/{carol_id}", headers=auth("bob"))
+    assert response.status_code == 200
+    
+    response = client.post(
+        "/api/v1/chores/",
+        json={"title": "Chore", "due_date": "2026-01-01", "assigned_user_ids": [carol_id]},
+        headers=auth("alice")
+    )
+    assert response.status_code == 200
+    # Members outside the household are skipped when assigning
+    chore_id = UUID(response.json()["id"])
+    assert db.query(ChoreAssignment).filter(ChoreAssignment.chore_id == chore_id).count() == 0
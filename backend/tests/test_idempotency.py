@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import anyio
+import pytest
+
+from app.core.idempotency import (
+    DatabaseIdempotencyStore,
+    IdempotencyMiddleware,
+    IdempotencyStore,
+    MemoryIdempotencyStore
+)
+from app.models.chore import Chore
+from app.models.idempotency_key import IdempotencyKey
+from tests.conftest import auth, create_household
+
+@pytest.fixture(params=["memory", "database"])
+def make_store(request):
+    store_class = MemoryIdempotencyStore if request.param == "memory" else DatabaseIdempotencyStore
+    return lambda **kwargs: store_class(**kwargs)
+
+def _post_chore(client, headers, title="Dishes"):
+    return client.post(
+        "/api/v1/chores/",
+        json={"title": title, "due_date": "2026-01-01"},
+        headers={**headers, "Idempotency-Key": "retry-1"}
+    )
+
+def test_retry_replays_original_response(client, db):
+    create_household(client, "alice")
+    
+    first = _post_chore(client, auth("alice"))
+    assert first.status_code == 200
+    # A refreshed token for the same user still replays
+    retry = _post_chore(client, {"Authorization": "Bearer test:alice:refreshed"})
+    assert retry.status_code == 200
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert db.query(Chore).count() == 1
+    
+    mismatch = _post_chore(client, auth("alice"), title="Laundry")
+    assert mismatch.status_code == 422
+
+def test_keys_are_scoped_per_user(client, db):
+    create_household(client, "alice")
+    create_household(client, "bob")
+    
+    assert _post_chore(client, auth("alice")).status_code == 200
+    response = _post_chore(client, auth("bob"))
+    assert response.status_code == 200
+    assert "Idempotent-Replayed" not in response.headers
+    assert db.query(Chore).count() == 2
+
+def test_invalid_token_bypasses_store(client, db):
+    response = _post_chore(client, {"Authorization": "Bearer forged"})
+    assert response.status_code == 401
+    assert db.query(IdempotencyKey).count() == 0
+
+def test_store_is_abstract():
+    with pytest.raises(TypeError):
+        IdempotencyStore()
+
+def test_expired_lease_can_be_taken_over(make_store):
+    store = make_store(lease_seconds=0)
+    assert store.reserve("key", "fp", "crashed") is None
+    time.sleep(0.01)
+    
+    assert store.reserve("key", "fp", "retry") is None
+    # The original request's late cleanup must not touch the new claim
+    store.complete("key", "crashed", 500, None, b"")
+    store.release("key", "crashed")
+    
+    store.complete("key", "retry", 201, "application/json", b"{}")
+    record = store.reserve("key", "fp", "third")
+    assert record.status_code == 201
+
+def test_in_flight_key_is_locked_until_lease_expires(make_store):
+    store = make_store(lease_seconds=60)
+    assert store.reserve("key", "fp", "first") is None
+    record = store.reserve("key", "fp", "second")
+    assert record is not None and record.status_code is None
+
+def test_purge_expired(make_store):
+    store = make_store(ttl_seconds=0, lease_seconds=60)
+    store.reserve("done", "fp", "a")
+    store.complete("done", "a", 200, None, b"ok")
+    store.reserve("running", "fp", "b")
+    time.sleep(0.01)
+    
+    assert store.purge_expired() == 1
+    assert store.reserve("done", "fp", "c") is None
+    assert store.reserve("running", "fp", "d") is not None
+
+def test_cancelled_request_releases_key():
+    store = MemoryIdempotencyStore()
+    
+    async def cancelled_app(scope, receive, send):
+        raise asyncio.CancelledError()
+    
+    middleware = IdempotencyMiddleware(cancelled_app, store=store)
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/chores/",
+        "query_string": b"",
+        "headers": [(b"authorization", b"Bearer test:alice"), (b"idempotency-key", b"k")],
+    }
+    
+    async def receive():
+        return {"type": "http.request", "body": b"{}", "more_body": False}
+    
+    async def send(message):
+        pass
+    
+    async def run():
+        with pytest.raises(asyncio.CancelledError):
+            await middleware(scope, receive, send)
+    
+    anyio.run(run)
+    assert store._records == {}
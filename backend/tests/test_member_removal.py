@@ -0,0 +1,159 @@
+from collections import Counter
+from uuid import UUID
+
+import pytest
+
+from app.core.household_context import HouseholdContext, get_household_context
+from app.main import app
+from app.models.chore_assignment import ChoreAssignment
+from tests.conftest import auth, create_chore, create_household
+
+@pytest.fixture
+def household(client):
+    return create_household(client, "alice", members=["bob", "carol"])
+
+def _remove(client, household, uid, reassign="round_robin", as_uid="alice"):
+    return client.delete(
+        f"/api/v1/households/{household['id']}/members/{household['member_ids'][uid]}",
+        params={"reassign": reassign},
+        headers=auth(as_uid)
+    )
+
+def _assignments(db, chore):
+    db.expire_all()
+    return {
+        (str(a.user_id), a.status)
+        for a in db.query(ChoreAssignment).filter(ChoreAssignment.chore_id == UUID(chore["id"]))
+    }
+
+def _pending_by_user(db, household):
+    db.expire_all()
+    names = {UUID(user_id): uid for uid, user_id in household["member_ids"].items()}
+    rows = db.query(ChoreAssignment.user_id).filter(ChoreAssignment.status == "pending")
+    return Counter(names[row.user_id] for row in rows)
+
+def _give(client, household, uid, count, **fields):
+    return [
+        create_chore(
+            client, "alice",
+            title=f"{uid} {i}",
+            due_date=f"2026-02-{i % 28 + 1:02d}",
+            assigned_user_ids=[household["member_ids"][uid]],
+            **fields
+        )
+        for i in range(count)
+    ]
+
+def test_round_robin_spreads_evenly(client, db, household):
+    _give(client, household, "carol", 4)
+    
+    response = _remove(client, household, "carol")
+    assert response.status_code == 200
+    assert response.json()["reassigned"] == 4
+    assert response.json()["released"] == 0
+    assert _pending_by_user(db, household) == {"alice": 2, "bob": 2}
+
+def test_least_loaded_fills_the_lightest_member(client, db, household):
+    _give(client, household, "bob", 3)
+    _give(client, household, "carol", 3)
+    
+    response = _remove(client, household, "carol", reassign="least_loaded")
+    assert response.json()["reassigned"] == 3
+    assert _pending_by_user(db, household) == {"alice": 3, "bob": 3}
+
+def test_release_unassigns(client, db, household):
+    chores = _give(client, household, "carol", 2)
+    
+    response = _remove(client, household, "carol", reassign="release")
+    assert response.json() == {"message": "Member removed successfully", "reassigned": 0, "released": 2}
+    assert all(_assignments(db, chore) == set() for chore in chores)
+
+def test_chore_still_pending_for_another_member_is_released(client, db, household):
+    bob_id, carol_id = household["member_ids"]["bob"], household["member_ids"]["carol"]
+    chore = create_chore(client, "alice", assigned_user_ids=[bob_id, carol_id])
+    
+    response = _remove(client, household, "carol")
+    assert response.json()["released"] == 1
+    assert response.json()["reassigned"] == 0
+    assert _assignments(db, chore) == {(bob_id, "pending")}
+
+@pytest.mark.parametrize("reassign", ["round_robin", "least_loaded"])
+def test_chore_completed_by_another_member_is_reassigned(client, db, household, reassign):
+    alice_id, bob_id, carol_id = (household["member_ids"][uid] for uid in ("alice", "bob", "carol"))
+    chore = create_chore(client, "alice", assigned_user_ids=[bob_id, carol_id])
+    assert client.post(f"/api/v1/chores/{chore['id']}/complete", headers=auth("bob")).status_code == 200
+    
+    response = _remove(client, household, "carol", reassign=reassign)
+    assert response.json()["reassigned"] == 1
+    assert response.json()["released"] == 0
+    # Bob already holds an assignment on it, so the pending work goes to alice
+    assert _assignments(db, chore) == {(bob_id, "completed"), (alice_id, "pending")}
+
+def test_completed_history_is_kept(client, db, household):
+    carol_id = household["member_ids"]["carol"]
+    chore = create_chore(client, "alice", assigned_user_ids=[carol_id])
+    assert client.post(f"/api/v1/chores/{chore['id']}/complete", headers=auth("carol")).status_code == 200
+    
+    assert _remove(client, household, "carol").json()["reassigned"] == 0
+    assert _assignments(db, chore) == {(carol_id, "completed")}
+
+def test_work_nobody_can_take_is_released(client, db):
+    household = create_household(client, "alice", members=["bob"])
+    alice_id, bob_id = household["member_ids"]["alice"], household["member_ids"]["bob"]
+    _give(client, household, "bob", 2)
+    # Alice, the only other member, already completed her part of this one
+    chore = create_chore(client, "alice", assigned_user_ids=[alice_id, bob_id])
+    assert client.post(f"/api/v1/chores/{chore['id']}/complete", headers=auth("alice")).status_code == 200
+    
+    response = _remove(client, household, "bob")
+    assert response.json()["reassigned"] == 2
+    assert response.json()["released"] == 1
+    assert _assignments(db, chore) == {(alice_id, "completed")}
+    assert _pending_by_user(db, household) == {"alice": 2}
+
+def test_removal_errors(client, household):
+    assert _remove(client, household, "alice").status_code == 400
+    assert _remove(client, household, "carol", as_uid="bob").status_code == 403
+    
+    outsider = create_household(client, "mallory")
+    response = client.delete(
+        f"/api/v1/households/{household['id']}/members/{outsider['member_ids']['mallory']}",
+        headers=auth("alice")
+    )
+    assert response.status_code == 404
+
+def test_stale_admin_transfer_conflicts(client, household):
+    alice_id, bob_id = (UUID(household["member_ids"][uid]) for uid in ("alice", "bob"))
+    assert client.post(
+        f"/api/v1/households/{household['id']}/admin",
+        json={"user_id": str(bob_id)},
+        headers=auth("alice")
+    ).status_code == 200
+    
+    # Alice's request was authorized against a context read before the transfer
+    stale = HouseholdContext(
+        id=UUID(household["id"]),
+        admin_id=alice_id,
+        member_ids=frozenset(UUID(user_id) for user_id in household["member_ids"].values())
+    )
+    app.dependency_overrides[get_household_context] = lambda: stale
+    try:
+        response = client.post(
+            f"/api/v1/households/{household['id']}/admin",
+            json={"user_id": household["member_ids"]["carol"]},
+            headers=auth("alice")
+        )
+    finally:
+        app.dependency_overrides.pop(get_household_context)
+    assert response.status_code == 409
+
+def test_removal_statement_count_is_constant(client, household, query_counter):
+    counts = []
+    for uid, chore_count in (("carol", 5), ("bob", 50)):
+        _give(client, household, uid, chore_count)
+        start = query_counter["count"]
+        response = _remove(client, household, uid, reassign="least_loaded")
+        assert response.json()["reassigned"] >= chore_count
+        counts.append(query_counter["count"] - start)
+    
+    assert counts[0] == counts[1]
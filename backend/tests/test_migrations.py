@@ -0,0 +1,22 @@
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+
+from app.core.database import engine
+
+def _alembic_config() -> Config:
+    # No ini file, so env.py leaves the test run's logging configuration alone
+    config = Config()
+    config.set_main_option("script_location", "alembic")
+    return config
+
+def test_initial_migration_adopts_existing_schema(db):
+    # Tables already exist, as in a database built by the old create_all() hook
+    assert inspect(engine).has_table("households")
+    
+    command.upgrade(_alembic_config(), "0001")
+    
+    version = db.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    assert version == "0001"
+    db.execute(text("DROP TABLE alembic_version"))
+    db.commit()
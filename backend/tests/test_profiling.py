@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.profiling import _explain
+from tests.conftest import auth, create_household
+
+@pytest.fixture
+def profile_admin(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_ADMIN_UIDS", "alice")
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 0.0)
+
+def test_profile_admin_gets_profile(client, profile_admin):
+    create_household(client, "alice")
+    
+    response = client.get("/api/v1/dashboard", headers={**auth("alice"), "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    
+    base = os.path.join(settings.PROFILE_DIR, profile_id)
+    assert os.path.exists(f"{base}.prof")
+    with open(f"{base}.sql.json") as f:
+        report = json.load(f)
+    assert report["path"] == "/api/v1/dashboard"
+    assert report["query_count"] == len(report["queries"]) > 0
+
+def test_profiling_requires_listed_admin(client, profile_admin):
+    create_household(client, "bob")
+    
+    response = client.get("/api/v1/dashboard", headers={**auth("bob"), "X-Profile": "1"})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    
+    response = client.get("/api/v1/dashboard", headers={"Authorization": "Bearer forged", "X-Profile": "1"})
+    assert "X-Profile-Id" not in response.headers
+
+def test_profiling_is_opt_in(client, profile_admin):
+    create_household(client, "alice")
+    
+    response = client.get("/api/v1/dashboard", headers=auth("alice"))
+    assert "X-Profile-Id" not in response.headers
+
+def test_slow_query_log_includes_plan(client, monkeypatch, caplog):
+    create_household(client, "alice")
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.000001)
+    
+    with caplog.at_level(logging.WARNING, logger="chorrus.sql"):
+        response = client.get("/api/v1/chores/", headers=auth("alice"))
+    
+    assert response.status_code == 200
+    slow = [record.getMessage() for record in caplog.records if record.name == "chorrus.sql"]
+    assert slow and any("Plan:" in message and "(not available)" not in message for message in slow)
+
+@pytest.mark.skipif(engine.dialect.name != "postgresql", reason="transaction aborts are PostgreSQL behaviour")
+def test_failed_explain_keeps_transaction_usable():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert _explain(conn, "SELECT no_such_column FROM users", {}) is None
+        assert conn.execute(text("SELECT 1")).scalar() == 1
@@ -0,0 +1,108 @@
+import anyio
+import pytest
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.core.load_shedding import ConcurrencyLimiter, LoadSheddingMiddleware
+from app.core.rate_limit import MemoryRateLimitBackend, RateLimitBackend
+from tests.conftest import auth, create_household
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+def test_memory_bucket_refills_at_rate():
+    backend = MemoryRateLimitBackend()
+    assert backend.take("user:a", rate=1.0, capacity=2) is None
+    assert backend.take("user:a", rate=1.0, capacity=2) is None
+    retry_after = backend.take("user:a", rate=1.0, capacity=2)
+    assert 0 < retry_after <= 1
+    # Buckets are independent per key
+    assert backend.take("user:b", rate=1.0, capacity=2) is None
+
+def test_user_limit_returns_429(client, monkeypatch):
+    create_household(client, "alice")
+    create_household(client, "bob")
+    monkeypatch.setattr(rate_limit, "rate_limit_backend", MemoryRateLimitBackend())
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_PER_SECOND", 0.01)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_BURST", 2)
+    
+    for _ in range(2):
+        assert client.get("/api/v1/chores/", headers=auth("alice")).status_code == 200
+    response = client.get("/api/v1/chores/", headers=auth("alice"))
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    
+    # Other users have their own bucket
+    assert client.get("/api/v1/chores/", headers=auth("bob")).status_code == 200
+    
+    assert 'chorrus_requests_throttled_total{scope="user"}' in client.get("/metrics").text
+
+def _metric(client, name: str) -> float:
+    for line in client.get("/metrics").text.splitlines():
+        if line.startswith(f"{name} "):
+            return float(line.split()[1])
+    return 0.0
+
+def test_second_concurrent_request_is_shed(client):
+    limiter = ConcurrencyLimiter()
+    limiter.limit = 1
+    events = {}
+    
+    async def slow_app(scope, receive, send):
+        events["entered"].set()
+        await events["finish"].wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+    
+    middleware = LoadSheddingMiddleware(slow_app, limiter=limiter)
+    responses = {}
+    
+    async def request(name):
+        messages = []
+        
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+        
+        async def send(message):
+            messages.append(message)
+        
+        await middleware({"type": "http", "method": "GET", "path": "/api/v1/chores/", "headers": []}, receive, send)
+        responses[name] = messages
+    
+    shed_before = _metric(client, "chorrus_requests_shed_total")
+    
+    async def run():
+        events.update(entered=anyio.Event(), finish=anyio.Event())
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(request, "first")
+            await events["entered"].wait()
+            await request("second")
+            events["finish"].set()
+    
+    anyio.run(run)
+    
+    assert responses["first"][0]["status"] == 200
+    start = responses["second"][0]
+    assert start["status"] == 503
+    assert (b"retry-after", b"1") in start["headers"]
+    assert limiter.in_flight == 0
+    assert _metric(client, "chorrus_requests_shed_total") == shed_before + 1
+
+def test_limit_shrinks_under_pool_pressure_and_recovers(monkeypatch):
+    monkeypatch.setattr(settings, "LOAD_SHED_MAX_IN_FLIGHT", 64)
+    monkeypatch.setattr(settings, "LOAD_SHED_MIN_IN_FLIGHT", 4)
+    monkeypatch.setattr(settings, "LOAD_SHED_POOL_WAIT_MS", 100)
+    limiter = ConcurrencyLimiter()
+    
+    for _ in range(100):
+        limiter.record_pool_wait(1000)
+    assert int(limiter.limit) == 4
+    
+    # Fast checkouts grow the limit back one request at a time
+    for _ in range(30):
+        limiter.record_pool_wait(0)
+    assert 4 < limiter.limit < 64
+    for _ in range(100):
+        limiter.record_pool_wait(0)
+    assert limiter.limit == 64